@@ -19,6 +19,20 @@ from arc.tools.system_tools import (
     type_text_keyboard, press_key, screenshot_screen
 )
 
+PIPER_MODEL = "models/piper/en_US-lessac-medium.onnx"
+RESPONSE_WAV = "/tmp/arc_response.wav"
+
+def speak(text: str):
+    """Synthesize with piper and play the result, without going through a shell."""
+    piper = subprocess.Popen(
+        ["piper", "--model", PIPER_MODEL, "--output_file", RESPONSE_WAV],
+        stdin=subprocess.PIPE
+    )
+    # Text goes in over stdin, so quotes in the reply can't break the command
+    piper.communicate(text.encode())
+    if piper.returncode == 0:
+        subprocess.run(["afplay", RESPONSE_WAV])
+
 async def run_arc():
     """
     Simplified ARC:
@@ -37,7 +51,7 @@ async def run_arc():
     logger.info("Initializing voice systems...")
     stt = get_whisper_stt()
     logger.info("Loading speech recognition...")
-    stt.load_model()
+    stt.warmup()  # Load plus one throwaway decode, so the first turn isn't slow
     
     # Initialize LLM
     logger.info(f"Connecting to Ollama ({config.llm.model_name})...")
@@ -121,11 +135,7 @@ Be concise in responses (1-2 sentences). Focus on being helpful."""
             
             # Speak
             logger.info("🔊 Speaking...")
-            subprocess.run(
-                f'echo "{response}" | piper --model models/piper/en_US-lessac-medium.onnx --output_file /tmp/arc_response.wav && afplay /tmp/arc_response.wav',
-                shell=True,
-                capture_output=True
-            )
+            await asyncio.to_thread(speak, response)
             logger.info("")
             
         except KeyboardInterrupt:
@@ -11,6 +11,7 @@ from langchain_ollama import ChatOllama
 from langgraph.graph import StateGraph, END
 
 from arc.config import get_config
+from arc.core.llm import ollama_client_kwargs
 from arc.brain.memory import get_memory_manager
 
 logger = logging.getLogger(__name__)
@@ -47,25 +48,9 @@ class AgentState(TypedDict):
     tool_result: Optional[str]
     final_response: Optional[str]
 
-# --- Nodes ---
+# --- Reasoning LLM ---
 
-def reasoning_engine(state: AgentState) -> dict:
-    """
-    The Single Cognitive Step (Phase 5).
-    Decides intent, considers preferences (Advisory), and flags memory usage.
-    """
-    config = get_config()
-    input_text = state["input_text"]
-    
-    # Phase 5: Soft Preferences Injection
-    try:
-        mem_mgr = get_memory_manager()
-        raw_facts = mem_mgr.get_profile()
-        context_block = "\n".join(f"- {f}" for f in raw_facts[-5:]) # Last 5 facts
-    except:
-        context_block = "None"
-    
-    system_prompt = f"""You are ARC (Autonomous Reasoning Companion).
+_REASONING_PROMPT = """You are ARC (Autonomous Reasoning Companion).
     
     [USER CONTEXT (ADVISORY)]
     {context_block}
@@ -98,14 +83,44 @@ def reasoning_engine(state: AgentState) -> dict:
 
     Tools: list_apps, list_files
     """
-    
-    try:
-        llm = ChatOllama(
+
+_reasoning_llm: Optional[ChatOllama] = None
+
+def get_reasoning_llm() -> ChatOllama:
+    """Shared JSON-mode client for the reasoning node, built on first use."""
+    global _reasoning_llm
+    if _reasoning_llm is None:
+        config = get_config()
+        _reasoning_llm = ChatOllama(
             model=config.llm.model_name,
             base_url=config.llm.base_url,
-            format="json", 
-            temperature=0
+            format="json",
+            temperature=0,
+            client_kwargs=ollama_client_kwargs()
         )
+    return _reasoning_llm
+
+# --- Nodes ---
+
+def reasoning_engine(state: AgentState) -> dict:
+    """
+    The Single Cognitive Step (Phase 5).
+    Decides intent, considers preferences (Advisory), and flags memory usage.
+    """
+    input_text = state["input_text"]
+    
+    # Phase 5: Soft Preferences Injection
+    try:
+        mem_mgr = get_memory_manager()
+        raw_facts = mem_mgr.get_profile()
+        context_block = "\n".join(f"- {f}" for f in raw_facts[-5:]) # Last 5 facts
+    except:
+        context_block = "None"
+    
+    system_prompt = _REASONING_PROMPT.format(context_block=context_block)
+    
+    try:
+        llm = get_reasoning_llm()
         
         messages = [
             SystemMessage(content=system_prompt),
@@ -60,8 +60,12 @@ class MCPConfig(BaseModel):
 class VoiceConfig(BaseModel):
     wake_word: str = Field("jarvis", description="Wake word to listen for")
     porcupine_access_key: Optional[SecretStr] = Field(None, description="Access key for Porcupine")
+    porcupine_model_path: Optional[str] = Field(None, description="Porcupine model parameters (.pv) to load instead of the bundled one")
     stt_model_size: Literal["tiny", "tiny.en", "base", "base.en", "small", "small.en", "medium", "medium.en", "large"] = "base"
+    stt_device: Literal["auto", "cpu", "cuda"] = Field("auto", description="Device for Whisper inference (auto picks CUDA when available)")
     tts_voice: str = "en_US-lessac-medium"
+    silence_rms: int = Field(500, description="int16 RMS below which mic audio counts as silence; lower it for quiet microphones")
+    audio_cpu: Optional[int] = Field(None, description="CPU core to pin the wake word audio thread to (Linux only)")
 
 class FilesystemConfig(BaseModel):
     allowed_roots: List[str] = Field(default_factory=lambda: [os.getcwd()])
@@ -126,6 +130,14 @@ def get_config() -> Settings:
         
     return _settings
 
+def reload_config() -> Settings:
+    """
+    Drop the cached configuration and re-read it, e.g. after .env is rewritten.
+    """
+    global _settings
+    _settings = None
+    return get_config()
+
 # For backwards compatibility if necessary, though we recommend using get_config()
 def load_config():
     return get_config().model_dump()
@@ -95,7 +95,7 @@ class ARCAgent:
         self.app = workflow.compile()
         logger.info("ARCAgent initialized.")
 
-    def _call_model(self, state: AgentState):
+    async def _call_model(self, state: AgentState):
         messages = state['messages']
         # Add system prompt if it's the first message? 
         # Typically handled by ensuring history starts with SystemMessage or prepending here.
@@ -104,7 +104,8 @@ class ARCAgent:
             system_prompt = self._get_system_prompt()
             messages = [SystemMessage(content=system_prompt)] + list(messages)
             
-        response = self.llm_with_tools.invoke(messages)
+        # Async client: the request doesn't tie up a worker thread while the model generates
+        response = await self.llm_with_tools.ainvoke(messages)
         return {"messages": [response]}
 
     def _should_continue(self, state: AgentState):
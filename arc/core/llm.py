@@ -9,6 +9,23 @@ from arc.config import get_config, LLMConfig
 
 logger = logging.getLogger(__name__)
 
+# Voice turns are often further apart than httpx's default 5s keep-alive,
+# so hold idle Ollama connections open longer instead of reconnecting per turn
+OLLAMA_KEEPALIVE_CONNECTIONS = 8
+OLLAMA_KEEPALIVE_EXPIRY = 300.0
+
+def ollama_client_kwargs() -> dict:
+    """
+    httpx options for ChatOllama's sync and async clients (pass as client_kwargs).
+    """
+    import httpx
+    return {
+        "limits": httpx.Limits(
+            max_keepalive_connections=OLLAMA_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OLLAMA_KEEPALIVE_EXPIRY,
+        )
+    }
+
 def get_llm(config: Optional[LLMConfig] = None) -> BaseChatModel:
     """
     Factory function to get the configured LLM instance.
@@ -67,6 +84,7 @@ def _create_ollama_llm(config: LLMConfig) -> BaseChatModel:
         model=model_name,
         base_url=base_url,
         temperature=config.temperature,
+        client_kwargs=ollama_client_kwargs(),
     )
 
 def _create_openai_llm(config: LLMConfig) -> BaseChatModel:
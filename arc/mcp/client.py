@@ -27,19 +27,37 @@ class MCPClientManager:
         logger.info("Starting MCP Client Manager...")
         
         servers = self.config.mcp.servers
+        opened = {}
         for name, server_config in servers.items():
             if server_config.enabled:
                 try:
-                    await self.connect_server(name, server_config)
+                    opened[name] = await self._open_session(name, server_config)
                 except Exception as e:
                     logger.error(f"Failed to connect to MCP server '{name}': {e}")
             else:
                 logger.info(f"MCP Server '{name}' is disabled.")
+        
+        # Handshakes overlap, so startup takes as long as the slowest server
+        results = await asyncio.gather(
+            *(self._initialize_session(name, session) for name, session in opened.items()),
+            return_exceptions=True
+        )
+        for name, result in zip(opened, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to connect to MCP server '{name}': {result}")
 
     async def connect_server(self, name: str, config: MCPServerConfig):
         """
         Connect to a specific MCP server using stdio transport.
         """
+        session = await self._open_session(name, config)
+        await self._initialize_session(name, session)
+
+    async def _open_session(self, name: str, config: MCPServerConfig) -> ClientSession:
+        """
+        Spawn the server and open its session. The transport contexts live on the
+        shared exit stack, so this must run in the task that will call stop().
+        """
         logger.info(f"Connecting to server: {name} ({config.command} {config.args})")
         
         server_params = StdioServerParameters(
@@ -60,10 +78,20 @@ class MCPClientManager:
             transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
             read, write = transport
             
-            session = await self.exit_stack.enter_async_context(
+            return await self.exit_stack.enter_async_context(
                 ClientSession(read, write)
             )
             
+        except Exception as e:
+            logger.error(f"Connection error for {name}: {e}")
+            raise
+
+    async def _initialize_session(self, name: str, session: ClientSession):
+        """
+        Run the MCP handshake and cache the server's tools. Safe to run
+        concurrently for different servers.
+        """
+        try:
             await session.initialize()
             self.sessions[name] = session
             logger.info(f"Connected to MCP server: {name}")
@@ -4,23 +4,139 @@ Wake Word → STT → Agent → TTS → Repeat
 """
 import asyncio
 import logging
+import re
 import time
-import subprocess
+import threading
 from typing import Optional, List, Callable
 from datetime import datetime, timedelta
 
 from arc.config import get_config
 from arc.voice.wake import get_wake_detector
 from arc.voice.stt import get_whisper_stt
-from arc.voice.tts import get_piper_tts
+from arc.voice.tts import get_piper_tts, iter_pcm
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_PARTS = 8  # Concurrent byte-range requests per file
+
+
+async def _download_ranged(url: str, dest, parts: int = DOWNLOAD_PARTS):
+    """
+    Download a file using concurrent HTTP Range requests.
+    Falls back to a single GET when the server doesn't honour range requests.
+    """
+    import shutil
+    import urllib.request
+
+    # Resolve redirects (HuggingFace -> CDN) and size with a one-byte ranged GET;
+    # a HEAD would turn into a full GET when urllib follows the redirect
+    probe = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with await asyncio.to_thread(urllib.request.urlopen, probe) as resp:
+        final_url = resp.geturl()
+        if resp.status != 206:
+            # No range support: the response already is the whole file
+            def save():
+                with open(dest, "wb") as f:
+                    shutil.copyfileobj(resp, f)
+            await asyncio.to_thread(save)
+            return
+        # Content-Range: bytes 0-0/<size>
+        total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+        size = int(total) if total.isdigit() else 0
+
+    if size < parts:
+        await asyncio.to_thread(urllib.request.urlretrieve, final_url, dest)
+        return
+
+    # Preallocate so each chunk can be written at its own offset
+    with open(dest, "wb") as f:
+        f.truncate(size)
+
+    def fetch(start: int, end: int):
+        req = urllib.request.Request(final_url, headers={"Range": f"bytes={start}-{end}"})
+        with urllib.request.urlopen(req) as resp, open(dest, "r+b") as f:
+            if resp.status != 206:
+                raise RuntimeError(f"Range request not honoured ({resp.status})")
+            f.seek(start)
+            while chunk := resp.read(1 << 16):
+                f.write(chunk)
+
+    step = -(-size // parts)
+    await asyncio.gather(*[
+        asyncio.to_thread(fetch, start, min(start + step, size) - 1)
+        for start in range(0, size, step)
+    ])
+
+
+def _make_tone(frequency: float, duration_ms: int, sample_rate: int, volume: float = 0.3) -> bytes:
+    """Render a sine beep as int16 PCM, with short fades to avoid clicks."""
+    import numpy as np
+    
+    n = int(sample_rate * duration_ms / 1000)
+    t = np.arange(n) / sample_rate
+    wave = np.sin(2 * np.pi * frequency * t) * volume
+    
+    fade = min(n // 2, int(sample_rate * 0.005))
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade)
+        wave[:fade] *= ramp
+        wave[-fade:] *= ramp[::-1]
+        
+    return (wave * 32767).astype(np.int16).tobytes()
+
+
+class _PCMPlayback:
+    """
+    Popen-like handle for synthesized PCM being written to an output stream.
+    Lets _monitor_playback poll/terminate/wait exactly as it would a player process.
+    """
+    
+    CHUNK_BYTES = 4096
+    
+    def __init__(self, pcm_chunks, out_stream):
+        self._chunks = pcm_chunks
+        self._stream = out_stream
+        self._cancel = threading.Event()
+        self.returncode: Optional[int] = None
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+        
+    def _pump(self):
+        try:
+            for pcm in self._chunks:
+                # Write in small slices so an interrupt takes effect quickly
+                view = memoryview(pcm)
+                for offset in range(0, len(view), self.CHUNK_BYTES):
+                    if self._cancel.is_set():
+                        self.returncode = -1
+                        return
+                    self._stream.write(bytes(view[offset:offset + self.CHUNK_BYTES]))
+            self.returncode = 0
+        except Exception as e:
+            logger.error(f"Playback failed: {e}")
+            self.returncode = 1
+            
+    def poll(self) -> Optional[int]:
+        return None if self._thread.is_alive() else self.returncode
+        
+    def terminate(self):
+        # Block until the writer lets go of the shared stream (at most one chunk)
+        self._cancel.set()
+        self._thread.join()
+        
+    def wait(self) -> Optional[int]:
+        self._thread.join()
+        return self.returncode
+
+
 class VoiceLoop:
     """
     Orchestrates the complete voice interaction flow.
     """
     
+    # Spoken commands that abort the current exchange
+    _INTERRUPT_RE = re.compile(r'\b(?:stop|cancel|nevermind)\b', re.IGNORECASE)
+    
     def __init__(self, agent_callback: Callable):
         """
         Initialize voice loop.
@@ -36,6 +152,11 @@ class VoiceLoop:
         self.stt = None
         self.tts = None
         
+        # Audio output (opened once, shared by every utterance)
+        self._pa = None
+        self._out_stream = None
+        self._sounds: dict = {}
+        
         # State
         self.running = False
         self.paused = False
@@ -50,38 +171,44 @@ class VoiceLoop:
         """Initialize all voice components."""
         logger.info("Initializing voice components...")
         
-        # STT
         self.stt = get_whisper_stt()
+        self.tts = get_piper_tts()
+        self.wake_detector = get_wake_detector()
+        
+        # Model load + warmup (CPU), voice download (network) and Porcupine
+        # setup are independent, so run them side by side
         logger.info("Loading speech recognition model...")
-        self.stt.load_model()
+        stt_result, wake_result, _ = await asyncio.gather(
+            asyncio.to_thread(self.stt.warmup),
+            asyncio.to_thread(self.wake_detector.initialize),
+            self._prepare_voice(),
+            return_exceptions=True
+        )
         
-        # TTS  
-        self.tts = get_piper_tts()
+        if isinstance(stt_result, Exception):
+            raise stt_result
         
         # Wake word (optional - requires Porcupine key)
-        try:
-            self.wake_detector = get_wake_detector()
-            self.wake_detector.initialize()
-            logger.info("Wake word detection ready")
-        except Exception as e:
-            logger.warning(f"Wake word disabled: {e}")
+        if isinstance(wake_result, Exception):
+            logger.warning(f"Wake word disabled: {wake_result}")
             logger.info("Running in continuous mode (no wake word)")
             self.wake_detector = None
+        else:
+            logger.info("Wake word detection ready")
             
-        # Ensure TTS model exists
-        await self._ensure_model_exists()
+        self._open_output_stream()
         
         logger.info("✅ Voice loop initialized")
 
     async def _ensure_model_exists(self):
         """Check for TTS model and download if missing."""
-        import urllib.request
         from pathlib import Path
         
-        model_path = Path(self.config.voice.tts_voice).resolve()
+        # Same resolution PiperTTS uses, so the download lands where it loads from
+        model_path = self.tts.model_path
         
-        # We need both .onnx and .onnx.json (implicit dependency for Piper)
-        json_path = model_path.with_suffix('.onnx.json')
+        # Piper loads its config from <model>.json next to the model
+        json_path = Path(f"{model_path}.json")
         
         if model_path.exists() and json_path.exists():
             logger.info(f"✅ Voice model found: {model_path.name}")
@@ -98,41 +225,74 @@ class VoiceLoop:
         json_url = f"{base_url}/en_US-lessac-medium.onnx.json"
         
         try:
-            # Download via a thread to strictly avoid blocking the loop, 
-            # though usually initialization is synchronous-ish.
-            def download():
-                logger.info(f"   Downloading .onnx ({model_url})...")
-                urllib.request.urlretrieve(model_url, model_path)
-                logger.info(f"   Downloading .json ({json_url})...")
-                urllib.request.urlretrieve(json_url, json_path)
-            
-            await asyncio.to_thread(download)
+            # Both files are fetched concurrently, each split into ranged chunks
+            logger.info(f"   Downloading .onnx ({model_url})...")
+            logger.info(f"   Downloading .json ({json_url})...")
+            await asyncio.gather(
+                _download_ranged(model_url, model_path),
+                _download_ranged(json_url, json_path),
+            )
             logger.info("✅ Voice model downloaded successfully")
             
         except Exception as e:
             logger.error(f"Failed to download voice model: {e}")
+            # Preallocated files would otherwise pass the exists() check next run
+            model_path.unlink(missing_ok=True)
+            json_path.unlink(missing_ok=True)
             logger.warning("TTS may fail if model is missing.")
     
+    async def _prepare_voice(self):
+        """Download the voice model if needed, then load it into the shared PiperTTS."""
+        await self._ensure_model_exists()
+        
+        try:
+            await asyncio.to_thread(self.tts.load_voice)
+        except Exception as e:
+            logger.error(f"Failed to load voice model: {e}")
+    
+    def _open_output_stream(self):
+        """Open the persistent PCM output stream at the voice model's sample rate."""
+        try:
+            import pyaudio
+            
+            sample_rate = 22050  # Piper medium-quality default
+            if self.tts.voice is not None:
+                sample_rate = self.tts.voice.config.sample_rate
+            
+            self._pa = pyaudio.PyAudio()
+            self._out_stream = self._pa.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=sample_rate,
+                output=True
+            )
+            
+            # Feedback beeps rendered once at the stream's rate
+            self._sounds = {
+                "wake": _make_tone(1000, 200, sample_rate),   # High pitch
+                "error": _make_tone(500, 500, sample_rate),   # Low pitch long
+            }
+        except Exception as e:
+            logger.error(f"Failed to open audio output: {e}")
+            
+    def _close_output_stream(self):
+        """Release the persistent output stream."""
+        if self._out_stream:
+            self._out_stream.close()
+            self._out_stream = None
+        if self._pa:
+            self._pa.terminate()
+            self._pa = None
+    
     def _play_sound(self, sound_type: str):
         """
-        Play confirmation/error sounds.
-        Non-blocking and non-fatal.
+        Play confirmation/error sounds from the preloaded tone buffers.
+        Non-fatal.
         """
         try:
-            import platform
-            system = platform.system()
-            
-            if system == 'Windows':
-                import winsound
-                # Simple beeps for Windows
-                if sound_type == "wake":
-                    winsound.Beep(1000, 200)  # High pitch
-                elif sound_type == "error":
-                    winsound.Beep(500, 500)   # Low pitch long
-            elif system == 'Darwin':
-                # macOS sounds
-                sound_file = "/System/Library/Sounds/Tink.aiff" if sound_type == "wake" else "/System/Library/Sounds/Basso.aiff"
-                subprocess.run(["afplay", sound_file], check=False, capture_output=True)
+            sound = self._sounds.get(sound_type)
+            if sound and self._out_stream:
+                self._out_stream.write(sound)
                 
         except Exception as e:
             # Swallow audio errors to keep loop running
@@ -149,62 +309,22 @@ class VoiceLoop:
     async def _speak_async(self, text: str, tone: str = "friendly"):
         """
         Speak text via TTS asynchronously.
-        Returns the subprocess.Popen object of the player.
+        The preloaded Piper voice synthesizes in-process, and its PCM
+        is streamed straight into the shared output stream.
+        Returns a Popen-like playback handle.
         """
-        try:
-            import platform
-            import os
-            import tempfile
-            
-            system = platform.system()
-            temp_dir = tempfile.gettempdir()
-            
-            # Paths
-            text_file_path = os.path.join(temp_dir, "arc_speak.txt")
-            audio_file_path = os.path.join(temp_dir, "arc_response.wav")
-            
-            # 1. Write text (used for debugging/logging mainly, Piper input)
-            with open(text_file_path, "w", encoding="utf-8") as f:
-                f.write(text)
-            
-            # 2. Run Piper (Generation is still blocking, usually fast for sentences)
-            # We assume generation is fast enough. If long generation, we'd chunk it.
-            # For now, we generate strictly before playing.
-            from pathlib import Path
-            model_abs_path = str(Path(self.config.voice.tts_voice).resolve())
+        if not self._out_stream or self.tts.voice is None:
+            logger.error("TTS Async failed: voice or audio output not ready")
+            return None
             
-            piper_cmd = [
-                "piper",
-                "--model", model_abs_path,
-                "--input_file", text_file_path,
-                "--output_file", audio_file_path
-            ]
+        try:
+            # Every tone shares the one voice until tone-specific models are added
+            voice = self.tts.voice
             
             # Log tone (Phase UX: Tone signal used for logging/future modulation)
             logger.info(f"🗣️ Speaking ({tone}): {text[:50]}...")
             
-            subprocess.run(piper_cmd, check=True, capture_output=True)
-            
-            # 3. Play Audio Asynchronously
-            player_process = None
-            
-            if system == 'Windows':
-                # Use PowerShell to confirm blocking-in-process behavior so we can kill it
-                # PlaySync() blocks the PowerShell process, which is what we want for Popen
-                ps_cmd = [
-                    "powershell", 
-                    "-c", 
-                    f"(New-Object Media.SoundPlayer '{audio_file_path}').PlaySync()"
-                ]
-                player_process = subprocess.Popen(ps_cmd)
-                
-            elif system == 'Darwin':
-                player_process = subprocess.Popen(["afplay", audio_file_path])
-                
-            else:
-                player_process = subprocess.Popen(["aplay", audio_file_path])
-                
-            return player_process
+            return _PCMPlayback(iter_pcm(voice, text), self._out_stream)
                 
         except Exception as e:
             logger.error(f"TTS Async failed: {e}")
@@ -302,22 +422,16 @@ class VoiceLoop:
             self._play_sound("wake")
             logger.info("🎤 Listening...")
             
-            # Record speech
+            # Record until the user stops talking, then transcribe once
+            user_input = ""
             try:
-                # Flush basic instructions
-                audio = self.stt.record_audio(duration=5.0)
+                stream = self.stt.stream_transcribe(max_duration=5.0)
+                while (step := await asyncio.to_thread(next, stream, None)) is not None:
+                    text, is_final = step
+                    if is_final:
+                        user_input = text
             except Exception as e:
-                logger.error(f"Recording failed: {e}")
-                proc = await self._speak_async("Sorry, I couldn't hear you", "apologetic")
-                await self._monitor_playback(proc)
-                return
-            
-            # Transcribe
-            logger.info("🔄 Processing...")
-            try:
-                user_input = self.stt.transcribe_audio(audio)
-            except Exception as e:
-                logger.error(f"Transcription failed: {e}")
+                logger.error(f"Speech recognition failed: {e}")
                 proc = await self._speak_async("Sorry, I didn't catch that", "apologetic")
                 await self._monitor_playback(proc)
                 return
@@ -328,7 +442,7 @@ class VoiceLoop:
             logger.info(f"You: {user_input}")
             
             # Check for interrupt commands (Text-based pre-processing)
-            if any(word in user_input.lower() for word in ['stop', 'cancel', 'nevermind']):
+            if self._INTERRUPT_RE.search(user_input) is not None:
                 proc = await self._speak_async("Okay", "neutral")
                 await self._monitor_playback(proc)
                 self.in_conversation = False
@@ -412,6 +526,8 @@ class VoiceLoop:
         if self.wake_detector:
             self.wake_detector.cleanup()
         
+        self._close_output_stream()
+        
         logger.info("Voice loop stopped")
     
     def pause(self):
@@ -0,0 +1,146 @@
+"""
+Voice Pipeline - Overlaps listening, reasoning and speech.
+Listen (streaming STT) → Think → Speak, connected by bounded queues.
+"""
+import asyncio
+import logging
+import re
+import threading
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MAX_UTTERANCE_SECONDS = 10.0
+QUEUE_SIZE = 2
+MAX_BATCH = 4  # Queued turns answered together when reasoning falls behind
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+Reply = Union[str, AsyncIterator[str]]
+
+
+async def iter_sentences(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Regroup streamed text chunks (e.g. LLM tokens) into whole sentences."""
+    buf = ""
+    async for chunk in chunks:
+        buf += chunk
+        *done, buf = _SENTENCE_END.split(buf)
+        for sentence in done:
+            if sentence.strip():
+                yield sentence
+    if buf.strip():
+        yield buf
+
+
+async def _speak_stream(tts, chunks: AsyncIterator[str]):
+    """Speak each sentence as soon as it is complete while the rest is still generating."""
+    sentences: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            async for sentence in iter_sentences(chunks):
+                await sentences.put(sentence)
+        finally:
+            await sentences.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (sentence := await sentences.get()) is not None:
+            logger.info(f"ARC: {sentence}")
+            await asyncio.to_thread(tts.speak, sentence)
+        await producer
+    finally:
+        # If playback failed, stop generating and reap the task (and any error it hit)
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def run_pipeline(stt, tts, think: Callable[[str], Awaitable[Reply]],
+                       think_batch: Optional[Callable[[List[str]], Awaitable[List[Reply]]]] = None):
+    """
+    Run the voice pipeline until cancelled.
+
+    Each utterance ends as soon as the user stops talking, and while it is
+    being reasoned about the mic is already listening for the next one. Audio
+    captured while ARC speaks is discarded and the capture starts over once
+    playback ends, so ARC never hears itself but a follow-up is still heard.
+
+    Args:
+        stt: WhisperSTT instance with the model loaded
+        tts: PiperTTS instance
+        think: Async function that takes the user's text and returns the reply,
+            either as a string or as an async iterator of streamed text chunks
+        think_batch: Optional async function answering several queued turns at
+            once (one reply per turn, in order); used when utterances back up
+    """
+    text_q: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+    reply_q: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+
+    # Read from the capture thread, so a threading.Event rather than an asyncio one
+    speaking = threading.Event()
+
+    def listen_once() -> str:
+        # Capture ends as soon as the user stops talking; one decode follows
+        user_input = ""
+        for text, is_final in stt.stream_transcribe(max_duration=MAX_UTTERANCE_SECONDS, pause=speaking):
+            if is_final:
+                user_input = text
+        return user_input
+
+    async def listen():
+        while True:
+            logger.info("🎤 Listening...")
+            try:
+                user_input = await asyncio.to_thread(listen_once)
+            except Exception as e:
+                logger.error(f"Listening failed: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            if not user_input.strip():
+                logger.info("❌ No speech detected\n")
+                continue
+
+            logger.info(f"You: {user_input}")
+            await text_q.put(user_input)
+
+    async def reason():
+        while True:
+            batch = [await text_q.get()]
+            # Anything else already waiting is answered in the same call
+            while think_batch and len(batch) < MAX_BATCH and not text_q.empty():
+                batch.append(text_q.get_nowait())
+
+            try:
+                if len(batch) > 1:
+                    logger.info(f"🧠 Answering {len(batch)} queued turns together...")
+                    responses = await think_batch(batch)
+                else:
+                    responses = [await think(batch[0])]
+            except Exception as e:
+                logger.error(f"Error: {e}")
+                continue
+
+            for response in responses:
+                if isinstance(response, str):
+                    logger.info(f"ARC: {response}")
+                await reply_q.put(response)
+
+    async def speak():
+        while True:
+            response = await reply_q.get()
+            logger.info("🔊 Speaking...")
+            speaking.set()
+            try:
+                if isinstance(response, str):
+                    await asyncio.to_thread(tts.speak, response)
+                else:
+                    await _speak_stream(tts, response)
+            except Exception as e:
+                logger.error(f"Error: {e}")
+            finally:
+                speaking.clear()
+            logger.info("")
+
+    await asyncio.gather(listen(), reason(), speak())
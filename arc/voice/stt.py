@@ -1,48 +1,119 @@
 """
-Speech-to-Text module using OpenAI Whisper.
+Speech-to-Text module using faster-whisper (CTranslate2).
 """
+import asyncio
+import bisect
 import logging
 import io
+import queue
+import threading
 import wave
 import numpy as np
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 
 try:
-    import whisper
+    import ctranslate2
+    from faster_whisper import WhisperModel, BatchedInferencePipeline, download_model
+    from huggingface_hub.utils import LocalEntryNotFoundError
     import pyaudio
 except ImportError:
-    whisper = None
+    ctranslate2 = None
+    WhisperModel = None
+    BatchedInferencePipeline = None
+    download_model = None
+    LocalEntryNotFoundError = None
     pyaudio = None
 
 from arc.config import get_config
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 8     # VAD segments decoded together by the batched pipeline
+BEAM_SIZE = 1      # Greedy decoding, as openai-whisper did (faster-whisper defaults to 5)
+BATCH_GAP = 0.5    # Seconds of silence between utterances laid end to end for one batched decode
+RECORD_CHUNK = 256  # Samples per PyAudio read (16 ms at 16 kHz)
+
+# Quantized weights halve memory traffic; int8 GEMMs run on AVX2/VNNI on CPU
+COMPUTE_TYPES = {"cpu": "int8", "cuda": "int8_float16"}
+
 class WhisperSTT:
     def __init__(self):
         self.config = get_config()
         self.model = None
+        self.pipeline = None
         self.model_size = self.config.voice.stt_model_size
+        self.model_dir = self.config.system.models_dir / "whisper"
+        self.device = "cpu"
+        self.silence_rms = self.config.voice.silence_rms  # int16 RMS below which a frame is silence
         self.audio_format = None
         self.pyaudio_instance = None
         
     def load_model(self, model_size: Optional[str] = None):
-        """Load Whisper model with specified size."""
-        if whisper is None:
-            raise ImportError("openai-whisper not installed. Run: pip install openai-whisper")
+        """Load Whisper model with specified size. A no-op if that model is already loaded."""
+        if WhisperModel is None:
+            raise ImportError("faster-whisper not installed. Run: pip install faster-whisper")
+            
+        if self.model is not None and model_size in (None, self.model_size):
+            return
             
         if model_size:
             self.model_size = model_size
             
-        logger.info(f"Loading Whisper model: {self.model_size}")
+        self.device = self._resolve_device()
+        compute_type = COMPUTE_TYPES[self.device]
+        logger.info(f"Loading Whisper model: {self.model_size} ({self.device}, {compute_type})")
         try:
-            self.model = whisper.load_model(self.model_size)
+            try:
+                # Cached CT2 weights are memory-mapped straight from disk, with no hub round-trip
+                self.model = WhisperModel(
+                    self.model_size, device=self.device, compute_type=compute_type,
+                    download_root=str(self.model_dir), local_files_only=True
+                )
+            except LocalEntryNotFoundError:
+                logger.info(f"Whisper model not cached, downloading to {self.model_dir}")
+                self.model = WhisperModel(
+                    self.model_size, device=self.device, compute_type=compute_type,
+                    download_root=str(self.model_dir)
+                )
+            self.pipeline = BatchedInferencePipeline(model=self.model)
             logger.info("Whisper model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
 
+    def download(self) -> str:
+        """Fetch the CT2 model into the local models dir so load_model never hits the network."""
+        if download_model is None:
+            raise ImportError("faster-whisper not installed. Run: pip install faster-whisper")
+            
+        logger.info(f"Downloading Whisper model: {self.model_size}")
+        return download_model(self.model_size, cache_dir=str(self.model_dir))
+
+    def warmup(self, seconds: float = 1.0, sample_rate: int = 16000):
+        """
+        Load the model if needed and run one throwaway decode on silence,
+        so the first real utterance doesn't pay the cold-start cost.
+        """
+        if not self.model:
+            self.load_model()
+            
+        # Bypass the VAD filter, which would skip decoding silence entirely
+        silence = np.zeros(int(sample_rate * seconds), dtype=np.float32)
+        segments, _ = self.model.transcribe(silence, language="en", vad_filter=False)
+        for _ in segments:
+            pass
+        logger.info("Whisper warmed up")
+
+    def _resolve_device(self) -> str:
+        """Pick the inference device from config, auto-detecting CUDA."""
+        device = self.config.voice.stt_device
+        if device != "auto":
+            return device
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda"
+        return "cpu"
+
     def transcribe_file(self, file_path: str, language: str = "en") -> str:
         """Transcribe audio from file."""
         if not self.model:
@@ -50,8 +121,7 @@ class WhisperSTT:
             
         try:
             logger.info(f"Transcribing file: {file_path}")
-            result = self.model.transcribe(file_path, language=language)
-            return result["text"].strip()
+            return self._transcribe(file_path, language)
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
@@ -62,51 +132,263 @@ class WhisperSTT:
             self.load_model()
             
         try:
+            # Mic audio with no voiced frame never reaches the encoder
+            if not self.has_speech(audio_data, sample_rate):
+                logger.debug(f"Skipping transcription: no frame above RMS {self.silence_rms}")
+                return ""
+                
             # Whisper expects float32 audio normalized to [-1, 1]
             if audio_data.dtype != np.float32:
                 audio_data = audio_data.astype(np.float32) / 32768.0
                 
-            result = self.model.transcribe(audio_data, language=language)
-            return result["text"].strip()
+            return self._transcribe(audio_data, language)
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
 
+    def has_speech(self, audio_data: np.ndarray, sample_rate: int = 16000, frame_ms: int = 30) -> bool:
+        """Whether any frame_ms frame of int16 or float32 audio is louder than the silence threshold."""
+        threshold = self.silence_rms / 32768.0 if audio_data.dtype == np.float32 else self.silence_rms
+        frame_samples = sample_rate * frame_ms // 1000
+        usable = audio_data.size // frame_samples * frame_samples
+        if usable == 0:
+            return False
+        frames = audio_data[:usable].reshape(-1, frame_samples).astype(np.float32)
+        return bool((np.sqrt(np.mean(frames ** 2, axis=1)) >= threshold).any())
+
+    def _transcribe(self, audio, language: str) -> str:
+        """Run the batched pipeline and join the segment texts."""
+        segments, _ = self.pipeline.transcribe(
+            audio, language=language, batch_size=BATCH_SIZE, beam_size=BEAM_SIZE, vad_filter=True
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    def transcribe_batch(self, audios: List[np.ndarray], sample_rate: int = 16000, language: str = "en") -> List[str]:
+        """
+        Transcribe several utterances with one batched decode.
+        The clips are laid end to end and each is passed to the pipeline as its own
+        region, so they are decoded together as one batch; segments are mapped back
+        to their utterance by start time.
+        """
+        if len(audios) == 1:
+            audio = audios[0]
+            return [self.transcribe_audio(audio, sample_rate, language) if audio.size else ""]
+            
+        if not self.model:
+            self.load_model()
+            
+        texts: List[List[str]] = [[] for _ in audios]
+        parts, clips, starts, owners = [], [], [], []
+        gap = np.zeros(int(sample_rate * BATCH_GAP), dtype=np.float32)
+        offset = 0
+        for i, audio in enumerate(audios):
+            # Same silence gate as a single clip, so silent clips come back "" either way
+            if audio.size == 0 or not self.has_speech(audio, sample_rate):
+                continue
+            if audio.dtype != np.float32:
+                audio = audio.astype(np.float32) / 32768.0
+            parts.extend((audio, gap))
+            # Clip timestamps are in seconds (faster-whisper 1.2+)
+            clips.append({"start": offset / sample_rate, "end": (offset + audio.size) / sample_rate})
+            starts.append(offset / sample_rate)
+            owners.append(i)
+            offset += audio.size + gap.size
+            
+        if not clips:
+            return ["" for _ in audios]
+            
+        try:
+            segments, _ = self.pipeline.transcribe(
+                np.concatenate(parts), language=language, batch_size=BATCH_SIZE,
+                beam_size=BEAM_SIZE, vad_filter=False, clip_timestamps=clips
+            )
+            for segment in segments:
+                clip = max(bisect.bisect_right(starts, segment.start) - 1, 0)
+                texts[owners[clip]].append(segment.text.strip())
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            raise
+            
+        return [" ".join(pieces).strip() for pieces in texts]
+
     def record_audio(self, duration: float = 5.0, sample_rate: int = 16000) -> np.ndarray:
-        """Record audio from microphone."""
+        """Record audio from microphone as float32 in [-1, 1], ready for Whisper."""
         if pyaudio is None:
             raise ImportError("pyaudio not installed")
             
         try:
             p = pyaudio.PyAudio()
             
+            # PortAudio converts to float32 as it captures, so there's
+            # no separate normalization pass over the recording
             stream = p.open(
-                format=pyaudio.paInt16,
+                format=pyaudio.paFloat32,
                 channels=1,
                 rate=sample_rate,
                 input=True,
-                frames_per_buffer=1024
+                frames_per_buffer=RECORD_CHUNK
             )
             
             logger.info(f"Recording for {duration} seconds...")
-            frames = []
-            
-            for _ in range(0, int(sample_rate / 1024 * duration)):
-                data = stream.read(1024)
-                frames.append(data)
-                
+
+            # Preallocate the whole capture and copy each chunk into place
+            # instead of joining a list of byte strings at the end
+            audio_data = np.empty(int(sample_rate * duration), dtype=np.float32)
+
+            for i in range(0, len(audio_data), RECORD_CHUNK):
+                n = min(RECORD_CHUNK, len(audio_data) - i)
+                data = stream.read(n, exception_on_overflow=False)
+                audio_data[i:i + n] = np.frombuffer(data, dtype=np.float32)
+
             stream.stop_stream()
             stream.close()
             p.terminate()
-            
-            # Convert to numpy array
-            audio_data = np.frombuffer(b''.join(frames), dtype=np.int16)
+
             return audio_data
             
         except Exception as e:
             logger.error(f"Audio recording failed: {e}")
             raise
 
+    def _capture_utterance(self, max_duration: float, sample_rate: int,
+                           frame_ms: int, endpoint_ms: int,
+                           pause: Optional[threading.Event] = None,
+                           no_speech_timeout: Optional[float] = None):
+        """
+        Capture from the microphone until endpoint_ms of silence follows speech
+        or max_duration is hit. Silence is judged per frame_ms frame.
+        Yields (buf, filled, speech_end, ended) after every block: the capture
+        buffer, bytes captured so far, the byte offset just past the last voiced
+        frame (0 until speech is heard), and whether capture has stopped.
+        While pause is set, incoming audio is dropped and the capture starts
+        over, so the utterance only holds audio heard after the pause ends.
+        If no_speech_timeout is given, capture also stops when no speech has
+        started within that many seconds.
+        """
+        # Capture runs on PortAudio's callback thread so decoding never drops audio
+        captured: queue.Queue = queue.Queue()
+        
+        def on_audio(in_data, frame_count, time_info, status):
+            captured.put(in_data)
+            return (None, pyaudio.paContinue)
+            
+        frame_samples = sample_rate * frame_ms // 1000
+        frame_bytes = frame_samples * 2
+        total_bytes = int(sample_rate * max_duration) * 2
+        give_up_bytes = int(sample_rate * no_speech_timeout) * 2 if no_speech_timeout else total_bytes
+        endpoint_frames = max(1, endpoint_ms // frame_ms)
+        buf = bytearray(total_bytes)
+        view = memoryview(buf)
+        filled = 0
+        checked = 0
+        speech_end = 0
+        silent_frames = 0
+        
+        p = pyaudio.PyAudio()
+        stream = p.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=sample_rate,
+            input=True,
+            frames_per_buffer=frame_samples,
+            stream_callback=on_audio
+        )
+        
+        try:
+            logger.info(f"Listening for up to {max_duration} seconds...")
+            while filled < total_bytes:
+                data = captured.get(timeout=2.0)
+                if pause is not None and pause.is_set():
+                    if filled:
+                        logger.debug(f"Dropped {filled / 2 / sample_rate:.1f}s of audio captured while paused")
+                        filled = checked = speech_end = silent_frames = 0
+                    continue
+                    
+                n = min(len(data), total_bytes - filled)
+                view[filled:filled + n] = data[:n]
+                filled += n
+                
+                # Endpoint detection on each complete frame
+                while filled - checked >= frame_bytes:
+                    frame = np.frombuffer(buf, dtype=np.int16, count=frame_samples, offset=checked)
+                    checked += frame_bytes
+                    if np.sqrt(np.mean(frame.astype(np.float32) ** 2)) < self.silence_rms:
+                        silent_frames += 1
+                    else:
+                        silent_frames = 0
+                        speech_end = checked
+                        
+                ended = (filled >= total_bytes
+                         or (speech_end and silent_frames >= endpoint_frames)
+                         or (not speech_end and filled >= give_up_bytes))
+                yield buf, filled, speech_end, ended
+                if ended:
+                    break  # End of speech
+        finally:
+            stream.stop_stream()
+            stream.close()
+            p.terminate()
+
+    def record_until_silence(self, max_duration: float = 10.0, sample_rate: int = 16000,
+                             frame_ms: int = 30, endpoint_ms: int = 500,
+                             no_speech_timeout: float = 3.0) -> np.ndarray:
+        """
+        Record one utterance, stopping once endpoint_ms of silence follows speech,
+        or after no_speech_timeout seconds if the user never starts talking.
+        Trailing silence is trimmed; returns an empty array if nothing was said.
+        """
+        if pyaudio is None:
+            raise ImportError("pyaudio not installed")
+            
+        buf, speech_end = bytearray(), 0
+        for buf, _, speech_end, _ in self._capture_utterance(max_duration, sample_rate, frame_ms, endpoint_ms,
+                                                              no_speech_timeout=no_speech_timeout):
+            pass
+        return np.frombuffer(buf, dtype=np.int16, count=speech_end // 2)
+
+    def stream_transcribe(self, max_duration: float = 5.0, chunk_duration: float = 1.0,
+                          sample_rate: int = 16000, language: str = "en",
+                          frame_ms: int = 30, endpoint_ms: int = 500,
+                          pause: Optional[threading.Event] = None, partials: bool = False):
+        """
+        Record one utterance from the microphone and transcribe it.
+        Yields (text, is_final) pairs, ending with the final transcript once
+        endpoint_ms of silence follows speech or max_duration is hit. Silence is
+        judged per frame_ms frame. While pause is set (e.g. during playback) the
+        capture is discarded and restarted.
+        With partials=True, a hypothesis is also yielded after every
+        chunk_duration of speech. Each one re-decodes the whole buffer on the
+        capture thread, delaying the endpoint check, so only enable it when
+        something actually displays them.
+        """
+        if pyaudio is None:
+            raise ImportError("pyaudio not installed")
+            
+        if not self.model:
+            self.load_model()
+            
+        chunk_bytes = int(sample_rate * chunk_duration) * 2
+        buf, filled, speech_end = bytearray(), 0, 0
+        decoded = 0
+        
+        for buf, filled, speech_end, ended in self._capture_utterance(max_duration, sample_rate, frame_ms, endpoint_ms, pause):
+            if filled < decoded:
+                decoded = 0  # Capture restarted after a pause
+                
+            # Partial hypothesis while the user is still talking
+            if partials and speech_end and not ended and filled - decoded >= chunk_bytes:
+                decoded = filled
+                audio = np.frombuffer(buf, dtype=np.int16, count=filled // 2)
+                yield self.transcribe_audio(audio, sample_rate, language), False
+            
+        # Nothing but silence: skip the final Whisper pass entirely
+        if not speech_end:
+            yield "", True
+            return
+            
+        audio = np.frombuffer(buf, dtype=np.int16, count=filled // 2)
+        yield self.transcribe_audio(audio, sample_rate, language), True
+
     def start_streaming(self):
         """Start continuous transcription mode (placeholder for future implementation)."""
         logger.warning("Streaming transcription not yet implemented")
@@ -117,6 +399,59 @@ class WhisperSTT:
         """Stop continuous transcription."""
         pass
 
+class AsyncBatcher:
+    """
+    Coalesces concurrent transcription requests into batched decodes.
+    Requests that arrive while a batch is decoding are flushed together as the
+    next batch, so a lone caller never waits on the timer unless max_wait_ms is set.
+    """
+    
+    def __init__(self, stt: WhisperSTT, max_batch: int = BATCH_SIZE, max_wait_ms: float = 0):
+        self.stt = stt
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        
+    async def submit(self, audio: np.ndarray) -> str:
+        """Queue one utterance and wait for its transcript."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+            
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio, future))
+        return await future
+        
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                    
+            try:
+                texts = await asyncio.to_thread(self.stt.transcribe_batch, [audio for audio, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+                
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
 # Singleton
 _whisper_stt: Optional[WhisperSTT] = None
 
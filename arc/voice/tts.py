@@ -2,10 +2,9 @@
 Text-to-Speech module using Piper TTS.
 """
 import logging
-import subprocess
 import wave
 import io
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 from queue import Queue
 from threading import Thread
@@ -15,97 +14,166 @@ try:
 except ImportError:
     pyaudio = None
 
+try:
+    from piper import PiperVoice
+except ImportError:
+    PiperVoice = None
+
 from arc.config import get_config
 
 logger = logging.getLogger(__name__)
 
+def iter_pcm(voice, text: str):
+    """Yield raw int16 PCM from an in-process Piper voice, sentence by sentence."""
+    if hasattr(voice, "synthesize_stream_raw"):
+        # piper-tts <= 1.2
+        yield from voice.synthesize_stream_raw(text)
+    else:
+        for chunk in voice.synthesize(text):
+            yield chunk.audio_int16_bytes
+
 class PiperTTS:
     def __init__(self):
         self.config = get_config()
         self.voice_name = self.config.voice.tts_voice
+        self.voice = None
         self.speaking = False
         self.audio_queue = Queue()
         self.playback_thread = None
         
+        # Output stream is opened on first playback and kept for the process lifetime
+        self.pyaudio_instance = None
+        self.out_stream = None
+        self.out_rate = None
+        
+    @property
+    def model_path(self) -> Path:
+        """
+        Path to the voice's .onnx model. A bare voice name such as
+        "en_US-lessac-medium" resolves to models/piper/<name>.onnx, where the
+        setup wizard downloads voices; anything else is taken as a path.
+        """
+        path = Path(self.voice_name)
+        if path.suffix != ".onnx" and len(path.parts) == 1:
+            path = self.config.system.models_dir / "piper" / f"{self.voice_name}.onnx"
+        return path.resolve()
+        
+    def load_voice(self):
+        """Load the Piper voice model once; every utterance reuses it."""
+        if self.voice is not None:
+            return self.voice
+            
+        if PiperVoice is None:
+            raise ImportError("piper-tts not installed. Run: pip install piper-tts")
+            
+        model_path = str(self.model_path)
+        logger.info(f"Loading Piper voice: {model_path}")
+        self.voice = PiperVoice.load(model_path)
+        return self.voice
+        
+    @property
+    def sample_rate(self) -> int:
+        return self.load_voice().config.sample_rate
+        
     def synthesize(self, text: str) -> bytes:
         """
         Synthesize text to audio using Piper TTS.
-        Returns WAV audio bytes.
+        Returns raw 16-bit mono PCM at self.sample_rate.
         """
         try:
-            # Piper TTS is typically called via command line
-            # Assuming piper binary is in PATH
-            # piper --model <model> --output_file -
-            
-            # For this implementation, we'll use a simplified approach
-            # In production, you'd need to:
-            # 1. Download/install piper models
-            # 2. Configure model paths
-            # 3. Handle voice selection
-            
+            voice = self.load_voice()
             logger.info(f"Synthesizing: {text[:50]}...")
+            return b"".join(iter_pcm(voice, text))
             
-            # Placeholder: In real implementation, call piper CLI or use piper_tts library
-            # Example command: echo "text" | piper --model en_US-lessac-medium --output_file output.wav
-            
-            cmd = [
-                "piper",
-                "--model", self.voice_name,
-                "--output-raw"
-            ]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            audio_data, error = process.communicate(input=text.encode())
-            
-            if process.returncode != 0:
-                logger.error(f"Piper TTS failed: {error.decode()}")
-                raise RuntimeError(f"TTS synthesis failed: {error.decode()}")
-                
-            return audio_data
-            
-        except FileNotFoundError:
-            logger.error("Piper TTS not found. Install from: https://github.com/rhasspy/piper")
-            raise
         except Exception as e:
             logger.error(f"TTS synthesis failed: {e}")
             raise
 
-    def play_audio(self, audio_data: bytes, sample_rate: int = 22050):
-        """Play audio bytes using pyaudio."""
+    def _get_output_stream(self, sample_rate: int):
+        """Return the persistent output stream, reopening only if the rate changes."""
+        if self.out_stream is not None and self.out_rate == sample_rate:
+            return self.out_stream
+            
+        if self.out_stream is not None:
+            self.out_stream.close()
+        if self.pyaudio_instance is None:
+            self.pyaudio_instance = pyaudio.PyAudio()
+            
+        self.out_stream = self.pyaudio_instance.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=sample_rate,
+            output=True
+        )
+        self.out_rate = sample_rate
+        return self.out_stream
+
+    def play_audio(self, audio_data: bytes, sample_rate: Optional[int] = None):
+        """Play raw PCM bytes using pyaudio."""
         if pyaudio is None:
             logger.error("pyaudio not installed")
             return
             
         try:
-            p = pyaudio.PyAudio()
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=sample_rate,
-                output=True
-            )
-            
+            stream = self._get_output_stream(sample_rate or self.sample_rate)
             stream.write(audio_data)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
             
         except Exception as e:
             logger.error(f"Audio playback failed: {e}")
 
     def speak(self, text: str):
         """Synthesize and play text immediately."""
+        self.speak_stream(text)
+
+    def speak_stream(self, text: str):
+        """
+        Play text while it is still being synthesized: Piper emits audio sentence
+        by sentence, and playback starts as soon as the first chunk is ready.
+        """
+        self.speak_many([text])
+
+    def speak_many(self, texts: List[str]):
+        """
+        Speak several phrases back to back on one voice and output stream.
+        The next phrase is synthesized while the current one is playing.
+        """
+        if pyaudio is None:
+            logger.error("pyaudio not installed")
+            return
+            
         try:
-            audio_data = self.synthesize(text)
-            self.play_audio(audio_data)
+            voice = self.load_voice()
+            stream = self._get_output_stream(voice.config.sample_rate)
         except Exception as e:
             logger.error(f"Speak failed: {e}")
+            return
+            
+        chunks: Queue = Queue(maxsize=8)
+        
+        def produce():
+            try:
+                for text in texts:
+                    logger.info(f"Synthesizing: {text[:50]}...")
+                    for pcm in iter_pcm(voice, text):
+                        chunks.put(pcm)
+            except Exception as e:
+                logger.error(f"TTS synthesis failed: {e}")
+            finally:
+                chunks.put(None)
+                
+        producer = Thread(target=produce, daemon=True)
+        producer.start()
+        
+        failed = False
+        while (pcm := chunks.get()) is not None:
+            if failed:
+                continue  # Drain so the producer can finish
+            try:
+                stream.write(pcm)
+            except Exception as e:
+                logger.error(f"Audio playback failed: {e}")
+                failed = True
+        producer.join()
 
     def save_audio(self, text: str, output_path: str):
         """Synthesize text and save to file."""
@@ -122,6 +190,15 @@ class PiperTTS:
         self.speaking = False
         # In a real implementation, this would interrupt the audio stream
 
+    def close(self):
+        """Release the output stream."""
+        if self.out_stream is not None:
+            self.out_stream.close()
+            self.out_stream = None
+        if self.pyaudio_instance is not None:
+            self.pyaudio_instance.terminate()
+            self.pyaudio_instance = None
+
 # Singleton
 _piper_tts: Optional[PiperTTS] = None
 
@@ -2,9 +2,13 @@
 Wake word detection module using Picovoice Porcupine.
 """
 import logging
+import os
+import signal
 import struct
+import time
+from array import array
 from typing import Optional, Callable
-from threading import Thread
+from threading import Thread, Lock
 
 try:
     import pvporcupine
@@ -17,6 +21,8 @@ from arc.config import get_config
 
 logger = logging.getLogger(__name__)
 
+FRAME_STATS_SIZE = 1024  # Recent per-frame processing times kept for frame_stats() (power of two)
+
 class WakeWordDetector:
     def __init__(self):
         self.config = get_config()
@@ -27,8 +33,32 @@ class WakeWordDetector:
         self.callback: Optional[Callable] = None
         self.listen_thread = None
         
-    def initialize(self, access_key: Optional[str] = None, sensitivity: float = 0.5):
-        """Initialize Porcupine with wake word."""
+        # Kept from initialize() so the engine can be rebuilt without reconfiguring
+        self._access_key: Optional[str] = None
+        self._keywords: list = []
+        self._sensitivity: Optional[float] = None
+        self._porcupine_lock = Lock()
+        
+        # Ring of recent process() times in ns, written only by the listen thread
+        self._frame_ns = array('q', bytes(8 * FRAME_STATS_SIZE))
+        self._frames_seen = 0
+        
+    def initialize(self, access_key: Optional[str] = None, sensitivity: Optional[float] = None):
+        """
+        Initialize Porcupine with wake word. The engine is built once per process;
+        later calls reuse it, hot-swapping it only if a different sensitivity is
+        passed. A different access key needs cleanup() first.
+        """
+        if self.porcupine is not None:
+            if access_key is not None and access_key != self._access_key:
+                logger.warning("Porcupine already initialized; ignoring new access key (call cleanup() first)")
+            if sensitivity is not None and sensitivity != self._sensitivity:
+                self.adjust_sensitivity(sensitivity)
+            return
+            
+        if sensitivity is None:
+            sensitivity = self._sensitivity or 0.5
+            
         if pvporcupine is None:
             raise ImportError("pvporcupine not installed. Run: pip install pvporcupine")
             
@@ -50,15 +80,31 @@ class WakeWordDetector:
             self.porcupine = pvporcupine.create(
                 access_key=access_key,
                 keywords=keywords,
-                sensitivities=[sensitivity]
+                sensitivities=[sensitivity] * len(keywords),
+                model_path=self.config.voice.porcupine_model_path
             )
+            self._access_key = access_key
+            self._keywords = keywords
+            self._sensitivity = sensitivity
             
-            logger.info(f"Porcupine initialized with keywords: {keywords}")
+            self.warmup()
+            
+            logger.info("Porcupine initialized with keywords: %s", keywords)
             
         except Exception as e:
-            logger.error(f"Porcupine initialization failed: {e}")
+            logger.error("Porcupine initialization failed: %s", e)
             raise
 
+    def warmup(self, frames: int = 2):
+        """
+        Run a few silent frames through the engine so the first real frame
+        doesn't pay for faulting in the model pages.
+        """
+        silence = (0,) * self.porcupine.frame_length
+        with self._porcupine_lock:
+            for _ in range(frames):
+                self.porcupine.process(silence)
+
     def on_wake_detected(self, callback: Callable):
         """Register callback to execute when wake word is detected."""
         self.callback = callback
@@ -83,6 +129,11 @@ class WakeWordDetector:
             logger.error("pyaudio not installed")
             return
             
+        # Ctrl+C / SIGTERM go to the main thread, never interrupting a frame read
+        if hasattr(signal, "pthread_sigmask"):
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+        self._pin_audio_thread()
+        
         try:
             self.pyaudio_instance = pyaudio.PyAudio()
             self.audio_stream = self.pyaudio_instance.open(
@@ -93,13 +144,21 @@ class WakeWordDetector:
                 frames_per_buffer=self.porcupine.frame_length
             )
             
+            # Frame decoder is built once; frame_length is fixed for the engine
+            frame_length = self.porcupine.frame_length
+            frame = struct.Struct("h" * frame_length)
+            
             logger.info("Listening for wake word...")
             
             while self.listening:
-                pcm = self.audio_stream.read(self.porcupine.frame_length, exception_on_overflow=False)
-                pcm = struct.unpack_from("h" * self.porcupine.frame_length, pcm)
+                pcm = self.audio_stream.read(frame_length, exception_on_overflow=False)
+                pcm = frame.unpack_from(pcm)
                 
-                keyword_index = self.porcupine.process(pcm)
+                start = time.perf_counter_ns()
+                with self._porcupine_lock:
+                    keyword_index = self.porcupine.process(pcm)
+                self._frame_ns[self._frames_seen & (FRAME_STATS_SIZE - 1)] = time.perf_counter_ns() - start
+                self._frames_seen += 1
                 
                 if keyword_index >= 0:
                     logger.info("Wake word detected!")
@@ -107,13 +166,52 @@ class WakeWordDetector:
                         self.callback()
                         
         except Exception as e:
-            logger.error(f"Listen loop error: {e}")
+            logger.error("Listen loop error: %s", e)
         finally:
             if self.audio_stream:
                 self.audio_stream.close()
             if self.pyaudio_instance:
                 self.pyaudio_instance.terminate()
 
+    def _pin_audio_thread(self):
+        """
+        Pin the calling thread to VOICE__AUDIO_CPU and, if permitted, give it
+        real-time priority, so it wakes on time every frame without migrating.
+        """
+        cpu = self.config.voice.audio_cpu
+        if cpu is None:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("VOICE__AUDIO_CPU is only supported on Linux, ignoring")
+            return
+            
+        try:
+            os.sched_setaffinity(0, {cpu})  # 0 = the calling thread
+            logger.info("Wake word audio thread pinned to CPU %s", cpu)
+        except OSError as e:
+            logger.warning("Could not pin audio thread to CPU %s: %s", cpu, e)
+            return
+            
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        except OSError as e:
+            logger.debug("Real-time priority unavailable for audio thread: %s", e)
+
+    def frame_stats(self) -> Optional[dict]:
+        """
+        p50/p99 Porcupine processing time (microseconds) over the most recent
+        frames, or None if nothing has been processed yet.
+        """
+        count = min(self._frames_seen, FRAME_STATS_SIZE)
+        if count == 0:
+            return None
+        times = sorted(self._frame_ns[:count])
+        return {
+            "frames": self._frames_seen,
+            "p50_us": times[count // 2] / 1000,
+            "p99_us": times[min(count - 1, count * 99 // 100)] / 1000,
+        }
+
     def stop_listening(self):
         """Stop listening for wake word."""
         self.listening = False
@@ -126,12 +224,32 @@ class WakeWordDetector:
         self.stop_listening()
         if self.porcupine:
             self.porcupine.delete()
+            self.porcupine = None
 
     def adjust_sensitivity(self, level: float):
-        """Adjust detection sensitivity (requires reinitialization)."""
-        logger.info(f"Sensitivity adjustment requires reinitialization: {level}")
-        # Would need to recreate porcupine instance
-        pass
+        """
+        Adjust detection sensitivity.
+        The new engine is built while the old one keeps listening, then swapped in,
+        so there is no gap in wake word detection.
+        """
+        if not self.porcupine:
+            self.initialize(sensitivity=level)
+            return
+            
+        logger.info("Adjusting wake word sensitivity: %s", level)
+        new_porcupine = pvporcupine.create(
+            access_key=self._access_key,
+            keywords=self._keywords,
+            sensitivities=[level] * len(self._keywords),
+            model_path=self.config.voice.porcupine_model_path
+        )
+        
+        with self._porcupine_lock:
+            old_porcupine = self.porcupine
+            self.porcupine = new_porcupine
+        self._sensitivity = level
+            
+        old_porcupine.delete()
 
 # Singleton
 _wake_detector: Optional[WakeWordDetector] = None
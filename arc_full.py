@@ -11,8 +11,10 @@ logger = logging.getLogger(__name__)
 
 from arc.voice.stt import get_whisper_stt
 from arc.voice.tts import get_piper_tts
+from arc.voice.pipeline import run_pipeline
 from arc.core.deep_agent import build_agent
 from arc.config import get_config
+from langchain_core.messages import HumanMessage
 
 async def run_arc():
     """
@@ -35,10 +37,21 @@ async def run_arc():
     
     logger.info("Loading speech recognition model...")
     stt.load_model()
+    # The throwaway first decode runs while the voice and agent load
+    stt_warmup = asyncio.create_task(asyncio.to_thread(stt.warmup))
+    llm_warmup = None
+    
+    logger.info("Loading voice model...")
+    try:
+        await asyncio.to_thread(tts.load_voice)
+    except Exception as e:
+        logger.warning(f"Voice model unavailable, replies will be text only: {e}")
     
     logger.info("Building AI agent with reasoning capabilities...")
     try:
         agent = await build_agent()
+        # Get the model loaded in Ollama now rather than on the first question
+        llm_warmup = asyncio.create_task(agent.llm.ainvoke([HumanMessage(content="Hi")]))
         logger.info("✅ Agent ready with tools:")
         logger.info("   - System control (apps, keyboard, mouse)")
         logger.info("   - WhatsApp automation")
@@ -50,53 +63,33 @@ async def run_arc():
         logger.info("Falling back to echo mode for voice testing...")
         agent = None
     
-    logger.info("\n✅ ARC is ready! Press Ctrl+C to exit\n")
-    
-    while True:
+    for name, task in (("Whisper", stt_warmup), ("LLM", llm_warmup)):
+        if task is None:
+            continue
         try:
-            # Listen
-            logger.info("🎤 Listening... (5 seconds)")
-            audio = stt.record_audio(duration=5.0)
-            
-            # Transcribe
-            logger.info("🔄 Processing speech...")
-            user_input = stt.transcribe_audio(audio)
-            
-            if not user_input.strip():
-                logger.info("❌ No speech detected\n")
-                continue
-            
-            logger.info(f"You: {user_input}")
-            
-            # Think & Act
-            if agent:
-                logger.info("🧠 Agent thinking...")
-                try:
-                    response = await agent.ainvoke(user_input)
-                    logger.info(f"ARC: {response}")
-                except Exception as e:
-                    response = f"I encountered an error: {str(e)}"
-                    logger.error(f"Agent error: {e}")
-            else:
-                # Fallback without agent
-                response = f"I heard: {user_input}. But I need an LLM backend to understand and act on this."
-            
-            # Speak
-            logger.info("🔊 Speaking...")
-            import subprocess
-            subprocess.run(
-                f'echo "{response}" | piper --model models/piper/en_US-lessac-medium.onnx --output_file /tmp/arc_response.wav && afplay /tmp/arc_response.wav',
-                shell=True,
-                capture_output=True
-            )
-            logger.info("")
-            
-        except KeyboardInterrupt:
-            logger.info("\n👋 ARC shutting down. Goodbye!")
-            break
+            await task
         except Exception as e:
-            logger.error(f"Error: {e}")
-            continue
+            logger.warning(f"{name} warmup failed: {e}")
+    
+    logger.info("\n✅ ARC is ready! Press Ctrl+C to exit\n")
+    
+    async def think(user_input: str) -> str:
+        # Think & Act
+        if agent:
+            logger.info("🧠 Agent thinking...")
+            try:
+                return await agent.ainvoke(user_input)
+            except Exception as e:
+                logger.error(f"Agent error: {e}")
+                return f"I encountered an error: {str(e)}"
+        # Fallback without agent
+        return f"I heard: {user_input}. But I need an LLM backend to understand and act on this."
+    
+    # Listen, transcribe, think and speak run as overlapping stages
+    await run_pipeline(stt, tts, think)
 
 if __name__ == "__main__":
-    asyncio.run(run_arc())
+    try:
+        asyncio.run(run_arc())
+    except KeyboardInterrupt:
+        logger.info("\n👋 ARC shutting down. Goodbye!")
@@ -5,14 +5,16 @@ Prioritizes system tools over general AI chat
 """
 import asyncio
 import logging
-import subprocess
 import re
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 from arc.voice.stt import get_whisper_stt
+from arc.voice.tts import get_piper_tts
+from arc.voice.pipeline import run_pipeline
 from arc.config import get_config
+from arc.core.llm import ollama_client_kwargs
 from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage, HumanMessage
 from arc.tools.system_tools import (
@@ -21,6 +23,13 @@ from arc.tools.system_tools import (
     is_app_running
 )
 
+# Routing patterns, compiled once at import
+_RE_OPEN = re.compile(r'open\s+(\w+)')
+_RE_CLOSE = re.compile(r'(?:close|quit|exit)\s+(\w+)')
+_RE_TYPE = re.compile(r'type\s+')
+_RE_IS_RUNNING = re.compile(r'is\s+(\w+)\s+running')
+_RE_NUMBERED = re.compile(r'^\s*\d+[.)]\s*', re.MULTILINE)
+
 class CommandRouter:
     """Smart command routing - tools first, then AI"""
     
@@ -37,14 +46,14 @@ class CommandRouter:
         # App opening
         if 'open' in text_lower:
             # Extract app name after 'open'
-            match = re.search(r'open\s+(\w+)', text_lower)
+            match = _RE_OPEN.search(text_lower)
             if match:
                 return ('open_app', {'app_name': match.group(1).capitalize()})
         
         # App closing
         if any(word in text_lower for word in ['close', 'quit', 'exit']) and \
            'app' in text_lower or 'application' in text_lower:
-            match = re.search(r'(?:close|quit|exit)\s+(\w+)', text_lower)
+            match = _RE_CLOSE.search(text_lower)
             if match:
                 return ('close_app', {'app_name': match.group(1)})
         
@@ -54,14 +63,18 @@ class CommandRouter:
         
         # Typing
         if 'type' in text_lower:
-            # Extract text to type
-            match = re.search(r'type\s+(.+)', text, re.IGNORECASE)
+            # Find the verb in the lowered text, then slice the payload from the
+            # original at the same offset to keep its casing
+            match = _RE_TYPE.search(text_lower)
             if match:
-                return ('type_text', {'text': match.group(1)})
+                source = text if len(text) == len(text_lower) else text_lower
+                payload = source[match.end():].strip()
+                if payload:
+                    return ('type_text', {'text': payload})
         
         # Check if app is running
         if 'is' in text_lower and 'running' in text_lower:
-            match = re.search(r'is\s+(\w+)\s+running', text_lower)
+            match = _RE_IS_RUNNING.search(text_lower)
             if match:
                 return ('is_running', {'app_name': match.group(1)})
         
@@ -78,21 +91,34 @@ async def run_arc():
     config = get_config()
     router = CommandRouter()
     
+    # Start the LLM warmup first so Ollama loads the model while Whisper and Piper load
+    logger.info(f"Connecting to Ollama ({config.llm.model_name})...")
+    llm = ChatOllama(
+        model=config.llm.model_name,
+        base_url=config.llm.base_url,
+        temperature=config.llm.temperature,
+        client_kwargs=ollama_client_kwargs()
+    )
+    warmup = asyncio.create_task(llm.ainvoke([HumanMessage(content="Hi")]))
+    
     # Initialize voice
     logger.info("Initializing voice systems...")
     stt = get_whisper_stt()
-    logger.info("Loading speech recognition...")
-    stt.load_model()
+    tts = get_piper_tts()
+    logger.info("Loading speech recognition and voice model...")
+    stt_result, tts_result = await asyncio.gather(
+        asyncio.to_thread(stt.warmup),  # Load plus one throwaway decode
+        asyncio.to_thread(tts.load_voice),
+        return_exceptions=True
+    )
+    if isinstance(stt_result, Exception):
+        warmup.cancel()
+        raise stt_result
+    if isinstance(tts_result, Exception):
+        logger.warning(f"Voice model unavailable, replies will be text only: {tts_result}")
     
-    # Initialize LLM
-    logger.info(f"Connecting to Ollama ({config.llm.model_name})...")
     try:
-        llm = ChatOllama(
-            model=config.llm.model_name,
-            base_url=config.llm.base_url,
-            temperature=config.llm.temperature
-        )
-        test_response = llm.invoke([HumanMessage(content="Hi")])
+        await warmup
         logger.info("✅ LLM connected")
     except Exception as e:
         logger.error(f"Failed to connect to Ollama: {e}")
@@ -101,6 +127,7 @@ async def run_arc():
     
     system_prompt = """You are ARC, a helpful voice assistant with system control.
 Keep responses brief (1-2 sentences). Be helpful and friendly."""
+    system_message = SystemMessage(content=system_prompt)
     
     logger.info("\n✅ ARC ready!")
     logger.info("Try commands like:")
@@ -110,90 +137,101 @@ Keep responses brief (1-2 sentences). Be helpful and friendly."""
     logger.info("  - 'Is Chrome running?'")
     logger.info("\nPress Ctrl+C to exit\n")
     
-    while True:
+    def run_tool(tool_name: str, params: dict) -> str:
+        # Execute tool
         try:
-            # Listen
-            logger.info("🎤 Listening... (5 seconds)")
-            audio = stt.record_audio(duration=5.0)
+            if tool_name == 'list_apps':
+                apps = list_running_apps.invoke({})
+                response = f"You have {len(apps)} apps running. Top 5: {', '.join(apps[:5])}"
             
-            # Transcribe
-            logger.info("🔄 Processing speech...")
-            user_input = stt.transcribe_audio(audio)
+            elif tool_name == 'open_app':
+                result = open_app.invoke(params)
+                response = result
             
-            if not user_input.strip():
-                logger.info("❌ No speech detected\n")
-                continue
+            elif tool_name == 'close_app':
+                result = close_app.invoke(params)
+                response = result
             
-            logger.info(f"You: {user_input}")
+            elif tool_name == 'screenshot':
+                result = screenshot_screen.invoke({'path': '/tmp/arc_screenshot.png'})
+                response = result
             
-            # Route command
-            tool_cmd = router.detect_tool_command(user_input)
+            elif tool_name == 'type_text':
+                result = type_text_keyboard.invoke(params)
+                response = result
             
-            if tool_cmd:
-                tool_name, params = tool_cmd
-                logger.info(f"🔧 Executing: {tool_name}")
-                
-                # Execute tool
-                try:
-                    if tool_name == 'list_apps':
-                        apps = list_running_apps.invoke({})
-                        response = f"You have {len(apps)} apps running. Top 5: {', '.join(apps[:5])}"
-                    
-                    elif tool_name == 'open_app':
-                        result = open_app.invoke(params)
-                        response = result
-                    
-                    elif tool_name == 'close_app':
-                        result = close_app.invoke(params)
-                        response = result
-                    
-                    elif tool_name == 'screenshot':
-                        result = screenshot_screen.invoke({'path': '/tmp/arc_screenshot.png'})
-                        response = result
-                    
-                    elif tool_name == 'type_text':
-                        result = type_text_keyboard.invoke(params)
-                        response = result
-                    
-                    elif tool_name == 'is_running':
-                        result = is_app_running.invoke(params)
-                        app = params['app_name']
-                        response = f"Yes, {app} is running" if result else f"No, {app} is not running"
-                    
-                    else:
-                        response = "Tool not implemented yet"
-                        
-                except Exception as e:
-                    response = f"Error executing tool: {str(e)}"
-                    logger.error(f"Tool error: {e}")
+            elif tool_name == 'is_running':
+                result = is_app_running.invoke(params)
+                app = params['app_name']
+                response = f"Yes, {app} is running" if result else f"No, {app} is not running"
             
             else:
-                # Use AI for general queries
-                logger.info("🧠 Asking AI...")
-                messages = [
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=user_input)
-                ]
-                ai_response = llm.invoke(messages)
-                response = ai_response.content
-            
-            logger.info(f"ARC: {response}")
+                response = "Tool not implemented yet"
             
-            # Speak
-            logger.info("🔊 Speaking...")
-            subprocess.run(
-                f'echo "{response}" | piper --model models/piper/en_US-lessac-medium.onnx --output_file /tmp/arc_response.wav && afplay /tmp/arc_response.wav',
-                shell=True,
-                capture_output=True
-            )
-            logger.info("")
-            
-        except KeyboardInterrupt:
-            logger.info("\n👋 ARC shutting down. Goodbye!")
-            break
         except Exception as e:
-            logger.error(f"Error: {e}")
-            continue
+            response = f"Error executing tool: {str(e)}"
+            logger.error(f"Tool error: {e}")
+        
+        return response
+    
+    async def stream_reply(user_input: str):
+        messages = [
+            system_message,
+            HumanMessage(content=user_input)
+        ]
+        async for chunk in llm.astream(messages):
+            yield chunk.content
+    
+    async def think(user_input: str):
+        # Route command
+        tool_cmd = router.detect_tool_command(user_input)
+        
+        if tool_cmd:
+            tool_name, params = tool_cmd
+            logger.info(f"🔧 Executing: {tool_name}")
+            # Tools block, so keep them off the event loop
+            return await asyncio.to_thread(run_tool, tool_name, params)
+        
+        # Use AI for general queries, speaking each sentence as it streams in
+        logger.info("🧠 Asking AI...")
+        return stream_reply(user_input)
+    
+    async def think_batch(batch: list):
+        # Tool commands run on their own; general queries share one LLM call
+        replies = [None] * len(batch)
+        questions = []
+        for i, user_input in enumerate(batch):
+            if router.detect_tool_command(user_input):
+                replies[i] = await think(user_input)
+            else:
+                questions.append(i)
+        
+        if len(questions) > 1:
+            logger.info(f"🧠 Asking AI ({len(questions)} questions in one prompt)...")
+            prompt = "Answer each numbered question briefly.\n" + "\n".join(
+                f"{n}. {batch[i]}" for n, i in enumerate(questions, 1)
+            )
+            ai_response = await llm.ainvoke([
+                system_message,
+                HumanMessage(content=prompt)
+            ])
+            answers = [a.strip() for a in _RE_NUMBERED.split(ai_response.content)[1:]]
+            if len(answers) == len(questions):
+                for i, answer in zip(questions, answers):
+                    replies[i] = answer
+                questions = []
+            else:
+                logger.warning("Batched reply did not match the questions, answering one by one")
+        
+        for i in questions:
+            replies[i] = await think(batch[i])
+        return replies
+    
+    # Listen, transcribe, think and speak run as overlapping stages
+    await run_pipeline(stt, tts, think, think_batch)
 
 if __name__ == "__main__":
-    asyncio.run(run_arc())
+    try:
+        asyncio.run(run_arc())
+    except KeyboardInterrupt:
+        logger.info("\n👋 ARC shutting down. Goodbye!")
@@ -6,10 +6,12 @@ import asyncio
 import logging
 import sys
 import re
+import functools
+from collections import OrderedDict, deque
+from typing import Optional
 
 from arc.ui.cli import start_cli
 from arc.config import get_config
-from langchain_core.messages import SystemMessage, HumanMessage
 from arc.tools.system_tools import (
     open_app, close_app, list_running_apps,
     screenshot_screen, is_app_running
@@ -22,134 +24,287 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Routing patterns, compiled once at import
+_RE_URL = re.compile(r'https?://[^\s]+')
+_RE_FILLERS = re.compile(r'\b(?:please|can you|could you|would you|kindly)\s+')
+_RE_OPEN_APP = (
+    re.compile(r'(?:open|launch|start)\s+(?:the\s+)?([a-zA-Z]+(?:\s+[a-zA-Z]+)?)'),
+    re.compile(r'(?:open|launch|start)\s+([a-zA-Z]+)'),
+)
+_RE_IS_RUNNING = re.compile(r'(?:is|check)\s+([a-zA-Z]+)\s+running')
+
+# Browser opening (websites)
+_BROWSER_KEYWORDS = ['browser', 'web', 'website', 'online', 'site']
+_SITE_KEYWORDS = {
+    'gmail': 'https://gmail.com',
+    'youtube': 'https://youtube.com',
+    'github': 'https://github.com',
+    'google': 'https://google.com',
+    'facebook': 'https://facebook.com',
+    'twitter': 'https://twitter.com',
+    'openrouter': 'https://openrouter.ai',
+    'claude': 'https://claude.ai',
+    'chatgpt': 'https://chat.openai.com',
+    'perplexity': 'https://perplexity.ai',
+}
+
+# Hybrid apps - default to app unless web keywords are used
+_HYBRID_APPS = {
+    'whatsapp': 'https://web.whatsapp.com',
+    'spotify': 'https://open.spotify.com',
+}
+
+# When several sites are mentioned, the earliest table entry wins
+_SITE_RANK = {site: i for i, site in enumerate([*_SITE_KEYWORDS, *_HYBRID_APPS])}
+
+# Keyword categories (bit flags)
+NAV_VERB = 1 << 0      # open a website
+LAUNCH_VERB = 1 << 1   # open an app
+BROWSER = 1 << 2
+SITE = 1 << 3
+HYBRID = 1 << 4
+APP_NOUN = 1 << 5
+WHAT_RUNNING = 1 << 6
+WHATSAPP = 1 << 7
+SCREENSHOT = 1 << 8
+RUNNING = 1 << 9
+IS_CHECK = 1 << 10
+TIME_WORD = 1 << 11
+TIME_QUERY = 1 << 12
+LIST_VERB = 1 << 13    # whole-word 'list' / 'show'
+HAS_URL = 1 << 14
+
+_KEYWORD_FLAGS: dict[str, int] = {}
+
+def _flag(words, flag: int):
+    for word in words:
+        _KEYWORD_FLAGS[word] = _KEYWORD_FLAGS.get(word, 0) | flag
+
+_flag(['open', 'go to', 'browse', 'visit'], NAV_VERB)
+_flag(['open', 'launch', 'start'], LAUNCH_VERB)
+_flag(_BROWSER_KEYWORDS, BROWSER)
+_flag(_SITE_KEYWORDS, SITE)
+_flag(_HYBRID_APPS, HYBRID)
+_flag(['app', 'program', 'process', 'running'], APP_NOUN)
+_flag(['what is running'], WHAT_RUNNING)
+_flag(['whatsapp'], WHATSAPP)
+_flag(['screenshot', 'screen shot', 'capture', 'snap'], SCREENSHOT)
+_flag(['running'], RUNNING)
+_flag(['is', 'check'], IS_CHECK)
+_flag(['time', 'date', 'day', 'today', 'clock', 'calendar'], TIME_WORD)
+_flag(['what', 'tell', 'show', 'current', 'today', 'now'], TIME_QUERY)
+_LIST_WORDS = frozenset(['list', 'show'])
+
+class _KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed keyword set.
+    A single pass over the text finds every keyword it contains as a substring.
+    """
+    
+    def __init__(self, keywords):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple] = [()]
+        
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (keyword,)
+        
+        # Breadth-first failure links; each state also reports its suffixes' keywords
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+    
+    def find(self, text: str) -> set:
+        """Return the set of keywords occurring in text."""
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            if self._out[state]:
+                found.update(self._out[state])
+        return found
+
+_KEYWORDS = _KeywordMatcher(_KEYWORD_FLAGS)
+
 class CommandRouter:
     """Route commands to tools or AI"""
     
     @staticmethod
     def detect_tool_command(text: str):
         """Detect if user wants to use a tool (voice-friendly)"""
-        text_lower = text.lower().strip()
-        
         # Remove common filler words for voice
-        text_lower = text_lower.replace('please ', '').replace('can you ', '').replace('could you ', '')
+        text_lower = _RE_FILLERS.sub('', text.lower().strip())
         
-        # Browser opening (websites) - check this FIRST
-        browser_keywords = ['browser', 'web', 'website', 'online', 'site']
-        site_keywords = {
-            'gmail': 'https://gmail.com',
-            'youtube': 'https://youtube.com',
-            'github': 'https://github.com',
-            'google': 'https://google.com',
-            'facebook': 'https://facebook.com',
-            'twitter': 'https://twitter.com',
-            'openrouter': 'https://openrouter.ai',
-            'claude': 'https://claude.ai',
-            'chatgpt': 'https://chat.openai.com',
-            'perplexity': 'https://perplexity.ai',
-        }
-        
-        # Hybrid apps - default to app unless web keywords are used
-        hybrid_apps = {
-            'whatsapp': 'https://web.whatsapp.com',
-            'spotify': 'https://open.spotify.com',
-        }
+        # URLs are taken from the original text to keep their case
+        url_match = _RE_URL.search(text)
+        url = url_match.group(0) if url_match else None
         
-        if 'open' in text_lower or 'go to' in text_lower or 'browse' in text_lower or 'visit' in text_lower:
-            # Check for pure site keywords first (always URLs)
-            for site, url in site_keywords.items():
-                if site in text_lower:
-                    return ('open_url', {'url': url})
-            
-            # Check for hybrid apps - ONLY if web/browser context is present
-            if any(kw in text_lower for kw in browser_keywords):
-                for site, url in hybrid_apps.items():
-                    if site in text_lower:
-                        return ('open_url', {'url': url})
-            
-            # Check for explicit URL
-            import re
-            url_match = re.search(r'https?://[^\s]+', text)
-            if url_match:
-                return ('open_url', {'url': url_match.group(0)})
-            
-            # Check if browser/website keywords mentioned - assume it's a website
-            if any(kw in text_lower for kw in browser_keywords):
-                # Extract the site name and try to construct URL
-                words = text_lower.split()
-                try:
-                    target_idx = -1
-                    for kw in ['open', 'visit', 'browse']:
-                        if kw in words:
-                            target_idx = words.index(kw)
-                            break
-                    
-                    if target_idx == -1: target_idx = 0
-
-                    # Get the next 1-3 words (website name)
-                    site_words = []
-                    for i in range(target_idx + 1, min(target_idx + 4, len(words))):
-                        if words[i] not in browser_keywords and words[i] not in ['the', 'a', 'to', 'on', 'in']:
-                            site_words.append(words[i])
-                    
-                    if site_words:
-                        site_name = ''.join(site_words)
-                        for tld in ['.com', '.ai', '.io', '.org', '.net']:
-                            potential_url = f'https://{site_name}{tld}'
-                            return ('open_url', {'url': potential_url, 'guess': True})
-                except:
-                    pass
-        
-        # App opening - Generic fallback for ANY app
-        # This handles "Open [App Name]" for any system application
-        if 'open' in text_lower or 'launch' in text_lower or 'start' in text_lower:
-            patterns = [
-                r'(?:open|launch|start)\s+(?:the\s+)?([a-zA-Z]+(?:\s+[a-zA-Z]+)?)',
-                r'(?:open|launch|start)\s+([a-zA-Z]+)',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    app_name = match.group(1).strip()
-                    app_name = ' '.join(word.capitalize() for word in app_name.split())
-                    return ('open_app', {'app_name': app_name})
-
-        # App listing - stricter check to avoid "WhatsApp" triggering it
-        # Must have "list" OR "show" ... AND "app" or "process"
-        # Avoid simple substring check for "what" if it's part of "whatsapp"
-        if (any(word in text_lower.split() for word in ['list', 'show']) or 'what is running' in text_lower) and \
-           any(word in text_lower for word in ['app', 'program', 'process', 'running']):
-             if 'whatsapp' not in text_lower: # Explicit safe guard
-                return ('list_apps', {})   
-        
-        # Screenshot
-        if any(word in text_lower for word in ['screenshot', 'screen shot', 'capture', 'snap']):
-            return ('screenshot', {})
-        
-        # Check if app is running
-        if 'running' in text_lower and ('is' in text_lower or 'check' in text_lower):
-            match = re.search(r'(?:is|check)\s+([a-zA-Z]+)\s+running', text_lower)
-            if match:
-                return ('is_running', {'app_name': match.group(1).capitalize()})
-        
-        # Get current time/date
-        if any(word in text_lower for word in ['time', 'date', 'day', 'today', 'clock', 'calendar']):
-            if any(word in text_lower for word in ['what', 'tell', 'show', 'current', 'today', 'now']):
-                return ('get_datetime', {})
+        command = _detect_tool_command_cached(text_lower, url)
+        if command is None:
+            return None
         
+        # Hand each caller its own params dict
+        tool_name, params = command
+        return (tool_name, dict(params))
+
+@functools.lru_cache(maxsize=512)
+def _detect_tool_command_cached(text_lower: str, url: Optional[str]):
+    """Memoized routing on the normalized utterance; params come back as a hashable tuple."""
+    command = _detect_tool_command(text_lower, url)
+    if command is None:
         return None
+    tool_name, params = command
+    return (tool_name, tuple(params.items()))
+
+# --- Route handlers: (text_lower, found, url) -> command, or None to keep looking ---
+
+def _route_site(text_lower, found, url):
+    # Pure site keywords are always URLs
+    site = min(found & _SITE_KEYWORDS.keys(), key=_SITE_RANK.__getitem__)
+    return ('open_url', {'url': _SITE_KEYWORDS[site]})
+
+def _route_hybrid(text_lower, found, url):
+    # Hybrid apps only count as websites when web/browser context is present
+    site = min(found & _HYBRID_APPS.keys(), key=_SITE_RANK.__getitem__)
+    return ('open_url', {'url': _HYBRID_APPS[site]})
+
+def _route_url(text_lower, found, url):
+    return ('open_url', {'url': url})
+
+def _route_guess_site(text_lower, found, url):
+    # Browser/website keywords mentioned - extract the site name and construct a URL
+    words = text_lower.split()
+    target_idx = 0
+    for kw in ['open', 'visit', 'browse']:
+        if kw in words:
+            target_idx = words.index(kw)
+            break
+
+    # Get the next 1-3 words (website name)
+    site_words = [
+        word for word in words[target_idx + 1:target_idx + 4]
+        if word not in _BROWSER_KEYWORDS and word not in ['the', 'a', 'to', 'on', 'in']
+    ]
+    if site_words:
+        return ('open_url', {'url': f"https://{''.join(site_words)}.com", 'guess': True})
+    return None
+
+def _route_open_app(text_lower, found, url):
+    # Generic fallback: "Open [App Name]" for any system application
+    for pattern in _RE_OPEN_APP:
+        match = pattern.search(text_lower)
+        if match:
+            app_name = ' '.join(word.capitalize() for word in match.group(1).split())
+            return ('open_app', {'app_name': app_name})
+    return None
+
+def _route_is_running(text_lower, found, url):
+    match = _RE_IS_RUNNING.search(text_lower)
+    if match:
+        return ('is_running', {'app_name': match.group(1).capitalize()})
+    return None
+
+# Checked in order; a rule fires when all `required` bits are set and no `forbidden` bit is
+_ROUTES = (
+    # Browser opening (websites) - checked FIRST
+    (NAV_VERB | SITE, 0, _route_site),
+    (NAV_VERB | BROWSER | HYBRID, 0, _route_hybrid),
+    (NAV_VERB | HAS_URL, 0, _route_url),
+    (NAV_VERB | BROWSER, 0, _route_guess_site),
+    # App opening
+    (LAUNCH_VERB, 0, _route_open_app),
+    # App listing - "WhatsApp" must not trigger it
+    (LIST_VERB | APP_NOUN, WHATSAPP, lambda *_: ('list_apps', {})),
+    (WHAT_RUNNING | APP_NOUN, WHATSAPP, lambda *_: ('list_apps', {})),
+    (SCREENSHOT, 0, lambda *_: ('screenshot', {})),
+    (RUNNING | IS_CHECK, 0, _route_is_running),
+    (TIME_WORD | TIME_QUERY, 0, lambda *_: ('get_datetime', {})),
+)
+
+def _detect_tool_command(text_lower: str, url: Optional[str]):
+    """Route a normalized utterance (lowercased, fillers removed) to a tool command."""
+    # One pass collects every keyword; routing below only tests category bits
+    found = _KEYWORDS.find(text_lower)
+    hits = 0
+    for keyword in found:
+        hits |= _KEYWORD_FLAGS[keyword]
+    if url:
+        hits |= HAS_URL
+    # 'list'/'show' must be whole words
+    if not _LIST_WORDS.isdisjoint(text_lower.split()):
+        hits |= LIST_VERB
+    
+    for required, forbidden, handler in _ROUTES:
+        if hits & required == required and not hits & forbidden:
+            command = handler(text_lower, found, url)
+            if command:
+                return command
+    
+    return None
 
 # Agent Callback
-from arc.brain.graph import create_graph
+_agent_graph = None
+
+def _get_agent_graph():
+    """Build the LangGraph agent on first use so tool-only sessions never import it."""
+    global _agent_graph
+    if _agent_graph is None:
+        from arc.brain.graph import create_graph
+        _agent_graph = create_graph()
+    return _agent_graph
+
+# Replies to plain chat turns, keyed on the normalized utterance (LRU order)
+_CHAT_CACHE_SIZE = 256
+_chat_cache: "OrderedDict[str, dict]" = OrderedDict()
 
-# Initialize graph once
-agent_graph = create_graph()
+def _changes_profile(result: dict) -> bool:
+    """Whether memory_processor rewrote the profile facts the reasoning prompt includes."""
+    if result.get("intent") == "memory_control":
+        return True  # forget_last / clear_all
+    memory_decision = result.get("memory_decision") or {}
+    return bool(memory_decision.get("long_term") and memory_decision.get("user_fact"))
+
+def _is_cacheable(text_input: str, result: dict) -> bool:
+    """Only pure chat answers that touch no tools, recovery, or memory can be replayed."""
+    if CommandRouter.detect_tool_command(text_input):
+        return False  # Tool commands (time, screenshots, ...) must always run
+    if result.get("intent") != "chat" or result.get("tool_command") or result.get("recovery_attempt"):
+        return False
+    if result.get("needs_memory"):
+        return False
+    memory_decision = result.get("memory_decision") or {}
+    return not memory_decision.get("user_fact")
 
 async def agent_callback(text_input: str) -> dict:
     """
     Callback for voice loop to process input using LangGraph.
     Returns: {"text": str, "tone": str}
     """
+    cache_key = ' '.join(text_input.lower().split())
+    cached = _chat_cache.get(cache_key)
+    if cached is not None:
+        _chat_cache.move_to_end(cache_key)
+        return dict(cached)
+
     try:
         # Run graph
         initial_state = {
@@ -159,7 +314,7 @@ async def agent_callback(text_input: str) -> dict:
         
         # Invoke graph (synchronous execution for now due to LangGraph async traits/event loop)
         import asyncio
-        result = await asyncio.to_thread(agent_graph.invoke, initial_state)
+        result = await asyncio.to_thread(_get_agent_graph().invoke, initial_state)
         
         intent = result.get("intent")
         tone = "friendly"
@@ -195,7 +350,15 @@ async def agent_callback(text_input: str) -> dict:
             tone = "apologetic"
             response_text = "I didn't understand that request."
             
-        return {"text": response_text, "tone": tone}
+        reply = {"text": response_text, "tone": tone}
+        if _changes_profile(result):
+            # Cached answers were reasoned against the old profile
+            _chat_cache.clear()
+        elif _is_cacheable(text_input, result):
+            _chat_cache[cache_key] = reply
+            if len(_chat_cache) > _CHAT_CACHE_SIZE:
+                _chat_cache.popitem(last=False)
+        return dict(reply)
             
     except Exception as e:
         import traceback
@@ -15,7 +15,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from arc.voice.tts import get_piper_tts
-from arc.voice.stt import get_whisper_stt
+from arc.voice.stt import get_whisper_stt, AsyncBatcher
+
+# Printed once per turn / at startup as a single write each
+LISTEN_BANNER = "\n".join([
+    "\n" + "=" * 50,
+    "🎤 Listening... (stops when you pause)",
+    "Say something or press Ctrl+C to exit",
+    "=" * 50,
+])
+
+MENU = """
+🎙️  ARC VOICE SYSTEM DEMO
+
+Choose an option:
+1. Test TTS only (Text-to-Speech)
+2. Test STT only (Speech-to-Text)
+3. Interactive demo (STT + TTS)
+4. Run all tests
+
+"""
 
 async def test_tts():
     """Test Text-to-Speech"""
@@ -32,15 +51,13 @@ async def test_tts():
             "How can I assist you today?"
         ]
         
-        for phrase in test_phrases:
-            logger.info(f"Speaking: {phrase}")
-            tts.speak(phrase)
-            await asyncio.sleep(1)  # Pause between phrases
+        logger.info("Speaking %d phrases...", len(test_phrases))
+        await asyncio.to_thread(tts.speak_many, test_phrases)
             
         logger.info("✅ TTS test completed successfully!")
         
     except Exception as e:
-        logger.error(f"❌ TTS test failed: {e}")
+        logger.error("❌ TTS test failed: %s", e)
         logger.info("Make sure Piper TTS is installed:")
         logger.info("  Download from: https://github.com/rhasspy/piper")
 
@@ -62,14 +79,14 @@ async def test_stt():
         logger.info("🔄 Transcribing...")
         text = stt.transcribe_audio(audio)
         
-        logger.info(f"📝 You said: '{text}'")
+        logger.info("📝 You said: '%s'", text)
         logger.info("✅ STT test completed successfully!")
         
     except ImportError as e:
-        logger.error(f"❌ Missing dependencies: {e}")
-        logger.info("Install with: pip3 install openai-whisper pyaudio")
+        logger.error("❌ Missing dependencies: %s", e)
+        logger.info("Install with: pip3 install faster-whisper pyaudio")
     except Exception as e:
-        logger.error(f"❌ STT test failed: {e}")
+        logger.error("❌ STT test failed: %s", e)
 
 async def interactive_demo():
     """Interactive voice demo"""
@@ -84,57 +101,50 @@ async def interactive_demo():
         
         # Welcome message
         welcome = "ARC voice interface initialized. Please speak after the beep."
-        logger.info(f"🔊 {welcome}")
-        tts.speak(welcome)
+        logger.info("🔊 %s", welcome)
+        await asyncio.to_thread(tts.speak_stream, welcome)
         
         # Load STT model
         logger.info("Loading speech recognition...")
-        stt.load_model()
+        await asyncio.to_thread(stt.warmup)  # Load plus one throwaway decode
+        batcher = AsyncBatcher(stt)
         
         while True:
-            logger.info("\n" + "=" * 50)
-            logger.info("🎤 Listening... (5 seconds)")
-            logger.info("Say something or press Ctrl+C to exit")
-            logger.info("=" * 50)
+            logger.info(LISTEN_BANNER)
             
             try:
-                # Record audio
-                audio = stt.record_audio(duration=5.0)
+                # Record until the user stops talking
+                audio = stt.record_until_silence()
                 
-                # Transcribe
+                # Transcribe (empty captures come back as "")
                 logger.info("🔄 Processing...")
-                text = stt.transcribe_audio(audio)
+                text = await batcher.submit(audio)
                 
                 if text.strip():
-                    logger.info(f"📝 You said: '{text}'")
+                    logger.info("📝 You said: '%s'", text)
                     
                     # Echo back
                     response = f"You said: {text}"
-                    logger.info(f"🔊 ARC: {response}")
-                    tts.speak(response)
+                    logger.info("🔊 ARC: %s", response)
+                    await asyncio.to_thread(tts.speak_stream, response)
                 else:
                     logger.info("❌ No speech detected")
                     
             except KeyboardInterrupt:
                 logger.info("\n👋 Exiting interactive mode...")
-                tts.speak("Goodbye!")
+                tts.speak_stream("Goodbye!")
                 break
             except Exception as e:
-                logger.error(f"Error in loop: {e}")
+                logger.error("Error in loop: %s", e)
                 continue
                 
     except Exception as e:
-        logger.error(f"❌ Demo failed: {e}")
+        logger.error("❌ Demo failed: %s", e)
 
 async def main():
     """Main entry point"""
-    print("\n" + "🎙️  ARC VOICE SYSTEM DEMO" + "\n")
-    print("Choose an option:")
-    print("1. Test TTS only (Text-to-Speech)")
-    print("2. Test STT only (Speech-to-Text)")
-    print("3. Interactive demo (STT + TTS)")
-    print("4. Run all tests")
-    print()
+    sys.stdout.write(MENU)
+    sys.stdout.flush()
     
     choice = input("Enter choice (1-4): ").strip()
     
@@ -145,6 +155,7 @@ async def main():
     elif choice == "3":
         await interactive_demo()
     elif choice == "4":
+        # Both tests share the get_*() singletons, so each model loads once
         await test_tts()
         await asyncio.sleep(2)
         await test_stt()
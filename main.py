@@ -5,6 +5,7 @@ Main entry point with multiple modes
 """
 import asyncio
 import argparse
+import importlib.util
 import logging
 import sys
 from pathlib import Path
@@ -63,25 +64,23 @@ async def setup_wizard():
     # Check dependencies
     console.print("\n[bold]Checking dependencies...[/bold]")
     
+    # Look the packages up without importing them (importing Whisper alone loads CTranslate2)
     deps_ok = True
-    try:
-        import whisper
+    if importlib.util.find_spec("faster_whisper"):
         console.print("✓ Whisper (STT) installed")
-    except ImportError:
-        console.print("✗ Whisper not installed - Run: pip install openai-whisper")
+    else:
+        console.print("✗ Whisper not installed - Run: pip install faster-whisper")
         deps_ok = False
     
-    try:
-        import pyaudio
+    if importlib.util.find_spec("pyaudio"):
         console.print("✓ PyAudio installed")
-    except ImportError:
+    else:
         console.print("✗ PyAudio not installed")
         deps_ok = False
     
-    try:
-        from langchain_ollama import ChatOllama
+    if importlib.util.find_spec("langchain_ollama"):
         console.print("✓ Ollama integration installed")
-    except ImportError:
+    else:
         console.print("✗ Ollama not installed - Run: pip install langchain-ollama")
         deps_ok = False
     
@@ -129,16 +128,52 @@ async def setup_wizard():
         "SYSTEM__DEBUG=false"
     ])
     
-    # Write .env
+    # Write .env (skipped when the answers didn't change)
     env_path = Path(".env")
-    with open(env_path, 'w') as f:
-        f.write('\n'.join(config_lines))
+    env_text = '\n'.join(config_lines)
+    if env_path.exists() and env_path.read_text(encoding='utf-8') == env_text:
+        console.print(f"\n[green]✓ Configuration unchanged ({env_path})[/green]")
+    else:
+        env_path.write_text(env_text, encoding='utf-8')
+        console.print(f"\n[green]✓ Configuration saved to {env_path}[/green]")
+        
+        # The Whisper preload and LLM test below must see the new answers
+        from arc.config import reload_config
+        reload_config()
     
-    console.print(f"\n[green]✓ Configuration saved to {env_path}[/green]")
+    # Fetch and load Whisper while the user answers the LLM prompt and the test runs.
+    # run_in_executor starts the work now; Prompt/Confirm block the event loop.
+    console.print(f"Loading Whisper '{stt_model}' model in the background...")
+    stt_ready = asyncio.get_running_loop().run_in_executor(None, _preload_stt)
     
     # Test LLM
     if Confirm.ask("\nTest LLM connection?"):
         await test_llm()
+    
+    try:
+        await stt_ready
+        console.print("[green]✓ Whisper model ready[/green]")
+    except Exception as e:
+        console.print(f"[red]✗ Whisper model load failed: {e}[/red]")
+
+def _preload_stt():
+    """Download (if needed) and load the configured Whisper model."""
+    from arc.voice.stt import get_whisper_stt
+    get_whisper_stt().load_model()
+
+async def preload_models():
+    """Download the Whisper model ahead of time so sessions load it from disk."""
+    from rich.console import Console
+    console = Console()
+    
+    try:
+        from arc.voice.stt import get_whisper_stt
+        stt = get_whisper_stt()
+        console.print(f"Downloading Whisper '{stt.model_size}' model...")
+        path = await asyncio.to_thread(stt.download)
+        console.print(f"[green]✓ Whisper model cached at {path}[/green]")
+    except Exception as e:
+        console.print(f"[red]✗ Whisper download failed: {e}[/red]")
 
 async def test_llm():
     """Test LLM connection."""
@@ -176,40 +211,48 @@ async def test_components():
     table.add_column("Status")
     table.add_column("Message")
     
-    # Test LLM
-    try:
+    # Each probe returns its status message or raises
+    def probe_llm():
         from arc.config import get_config
         from langchain_ollama import ChatOllama
         config = get_config()
         llm = ChatOllama(model=config.llm.model_name, base_url=config.llm.base_url)
         llm.invoke([{"role": "user", "content": "test"}])
-        table.add_row("LLM", "[green]✓[/green]", f"{config.llm.model_name}")
-    except Exception as e:
-        table.add_row("LLM", "[red]✗[/red]", str(e)[:50])
+        return f"{config.llm.model_name}"
     
-    # Test STT
-    try:
+    def probe_stt():
         from arc.voice.stt import get_whisper_stt
         stt = get_whisper_stt()
-        table.add_row("STT", "[green]✓[/green]", "Whisper ready")
-    except Exception as e:
-        table.add_row("STT", "[red]✗[/red]", str(e)[:50])
+        return "Whisper ready"
     
-    # Test TTS
-    try:
+    def probe_tts():
         from arc.voice.tts import get_piper_tts
         tts = get_piper_tts()
-        table.add_row("TTS", "[green]✓[/green]", "Piper ready")
-    except Exception as e:
-        table.add_row("TTS", "[red]✗[/red]", str(e)[:50])
+        return "Piper ready"
     
-    # Test Tools
-    try:
+    def probe_tools():
         from arc.tools.system_tools import list_running_apps
         apps = list_running_apps.invoke({})
-        table.add_row("System Tools", "[green]✓[/green]", f"{len(apps)} apps")
-    except Exception as e:
-        table.add_row("System Tools", "[red]✗[/red]", str(e)[:50])
+        return f"{len(apps)} apps"
+    
+    probes = [
+        ("LLM", probe_llm),
+        ("STT", probe_stt),
+        ("TTS", probe_tts),
+        ("System Tools", probe_tools),
+    ]
+    
+    # Probes are independent, so the wait is the slowest one rather than the sum
+    results = await asyncio.gather(
+        *(asyncio.to_thread(probe) for _, probe in probes),
+        return_exceptions=True
+    )
+    
+    for (name, _), result in zip(probes, results):
+        if isinstance(result, Exception):
+            table.add_row(name, "[red]✗[/red]", str(result)[:50])
+        else:
+            table.add_row(name, "[green]✓[/green]", result)
     
     console.print(table)
 
@@ -250,6 +293,12 @@ async def main():
         help='Run setup wizard'
     )
     
+    parser.add_argument(
+        '--preload',
+        action='store_true',
+        help='Download speech models ahead of time'
+    )
+    
     parser.add_argument(
         '--test',
         action='store_true',
@@ -283,6 +332,11 @@ async def main():
             await setup_wizard()
             return
         
+        # Download models
+        if args.preload:
+            await preload_models()
+            return
+        
         # Test components
         if args.test:
             await test_components()
@@ -3,7 +3,6 @@
 ARC - Interactive Talking Assistant
 Simple conversation mode without wake word (for testing)
 """
-import asyncio
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -12,7 +11,7 @@ logger = logging.getLogger(__name__)
 from arc.voice.stt import get_whisper_stt
 from arc.voice.tts import get_piper_tts
 
-async def talk():
+def talk():
     """Simple talk loop"""
     logger.info("🤖 ARC Assistant - Conversation Mode")
     logger.info("=" * 50)
@@ -22,43 +21,44 @@ async def talk():
     stt = get_whisper_stt()
     
     logger.info("Loading speech recognition model...")
-    stt.load_model()
+    stt.warmup()  # Load plus one throwaway decode, so the first turn isn't slow
+    
+    logger.info("Loading voice model...")
+    try:
+        tts.load_voice()
+    except Exception as e:
+        logger.warning("Voice model unavailable, replies will be text only: %s", e)
     
     logger.info("✅ Ready! Press Ctrl+C to exit\n")
     
     while True:
         try:
             # Listen
-            logger.info("🎤 Listening... (speak for 5 seconds)")
-            audio = stt.record_audio(duration=5.0)
+            logger.info("🎤 Listening... (stops when you pause)")
+            audio = stt.record_until_silence()
             
-            # Transcribe
+            # Transcribe (skipped when nothing was said)
             logger.info("🔄 Processing...")
-            text = stt.transcribe_audio(audio)
+            text = stt.transcribe_audio(audio) if audio.size else ""
             
             if not text.strip():
                 logger.info("❌ No speech detected\n")
                 continue
             
-            logger.info(f"You said: {text}")
+            logger.info("You said: %s", text)
             
             # Simple echo response (replace with agent later)
             response = f"I heard you say: {text}"
-            logger.info(f"🤖 ARC: {response}\n")
+            logger.info("🤖 ARC: %s\n", response)
             
-            # Speak via command line (faster than Python)
-            import subprocess
-            subprocess.run(
-                f'echo "{response}" | piper --model models/piper/en_US-lessac-medium.onnx --output_file /tmp/arc_response.wav && afplay /tmp/arc_response.wav',
-                shell=True,
-                capture_output=True
-            )
+            # Speak in-process on the preloaded voice
+            tts.speak(response)
             
         except KeyboardInterrupt:
             logger.info("\n👋 Goodbye!")
             break
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
 
 if __name__ == "__main__":
-    asyncio.run(talk())
+    talk()
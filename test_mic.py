@@ -5,6 +5,7 @@ Test microphone input
 import pyaudio
 import wave
 import sys
+import time
 
 print("🎤 Microphone Test")
 print("=" * 50)
@@ -23,22 +24,33 @@ try:
     print("\n🎙️  Recording 3 seconds of audio...")
     print("Speak now!")
     
+    # PortAudio's callback thread copies each block straight into a
+    # preallocated buffer (int16 = 2 bytes/sample); no per-read Python loop
+    buf = bytearray(16000 * 3 * 2)
+    view = memoryview(buf)
+    filled = 0
+    
+    def on_audio(in_data, frame_count, time_info, status):
+        global filled
+        n = min(len(in_data), len(buf) - filled)
+        view[filled:filled + n] = in_data[:n]
+        filled += n
+        return (None, pyaudio.paComplete if filled >= len(buf) else pyaudio.paContinue)
+    
     stream = p.open(
         format=pyaudio.paInt16,
         channels=1,
         rate=16000,
         input=True,
-        frames_per_buffer=1024
+        frames_per_buffer=256,
+        stream_callback=on_audio
     )
     
-    frames = []
-    for _ in range(0, int(16000 / 1024 * 3)):
-        data = stream.read(1024)
-        frames.append(data)
+    while stream.is_active():
+        time.sleep(0.1)
     
     stream.stop_stream()
     stream.close()
-    p.terminate()
     
     # Save to file
     output_file = "/tmp/arc_mic_test.wav"
@@ -46,14 +58,23 @@ try:
     wf.setnchannels(1)
     wf.setsampwidth(p.get_sample_size(pyaudio.paInt16))
     wf.setframerate(16000)
-    wf.writeframes(b''.join(frames))
+    wf.writeframes(view[:filled])
     wf.close()
     
     print(f"✅ Recording saved to: {output_file}")
     print("Playing back...")
     
-    import subprocess
-    subprocess.run(["afplay", output_file])
+    # Play through the same PortAudio instance instead of spawning a player
+    out = p.open(
+        format=pyaudio.paInt16,
+        channels=1,
+        rate=16000,
+        output=True
+    )
+    out.write(bytes(view[:filled]))
+    out.stop_stream()
+    out.close()
+    p.terminate()
     
     print("✅ Microphone test complete!")
     
@@ -34,7 +34,7 @@ def verify_stt():
         
     except ImportError as e:
         logger.error(f"Missing dependencies: {e}")
-        logger.info("Install with: pip install openai-whisper pyaudio")
+        logger.info("Install with: pip install faster-whisper pyaudio")
     except Exception as e:
         logger.error(f"STT Verification Failed: {e}")
 
@@ -1,18 +1,25 @@
 import logging
 import sys
 import os
-import time
+import threading
 
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add project root to path (once, even if this module is imported repeatedly)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from arc.voice.wake import get_wake_detector
 
-logging.basicConfig(level=logging.INFO)
+# Leave logging alone when a harness has already configured it
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+wake_event = threading.Event()
+
 def on_wake():
     logger.info("🎤 WAKE WORD DETECTED!")
+    wake_event.set()
 
 def verify_wake():
     logger.info("Verifying Wake Word Detection...")
@@ -30,18 +37,34 @@ def verify_wake():
         logger.info("Say the wake word (default: 'jarvis' - or custom 'ARC' if configured)")
         detector.start_listening()
         
-        # Listen for 10 seconds
+        # Listen for up to 10 seconds, stopping as soon as the wake word fires
         logger.info("Listening for 10 seconds...")
-        time.sleep(10)
+        try:
+            detected = wake_event.wait(timeout=10.0)
+        except KeyboardInterrupt:
+            detected = None
         
         detector.stop_listening()
         detector.cleanup()
         
-        logger.info("Wake word detection test completed")
+        stats = detector.frame_stats()
+        if stats:
+            logger.info(
+                "Porcupine frame time: p50 %.0f µs, p99 %.0f µs (%d frames)",
+                stats["p50_us"], stats["p99_us"], stats["frames"]
+            )
+        
+        if detected:
+            logger.info("Wake word detection test completed")
+        elif detected is None:
+            logger.info("Wake word detection test interrupted")
+        else:
+            logger.warning("No wake word detected within 10 seconds")
         
     except Exception as e:
-        logger.error(f"Wake Word Verification Failed: {e}")
+        logger.error("Wake Word Verification Failed: %s", e)
         logger.info("Ensure VOICE__PORCUPINE_ACCESS_KEY is set in .env")
+        logger.info("If VOICE__PORCUPINE_MODEL_PATH is set, check that the .pv file exists")
         logger.info("Get access key from: https://console.picovoice.ai/")
 
 if __name__ == "__main__":